@@ -56,12 +56,11 @@ def generate_report(tables_file=None, objects_file=None, table_deps_file=None, o
         objects = object_parser.parse(config.objects_file)
         progress_tracker.update()
 
-        table_dep_parser = DependencyParser(config)
-        table_dependencies = table_dep_parser.parse_table_dependencies(config.table_dependencies_file)
+        dependency_parser = DependencyParser(config)
+        table_dependencies = dependency_parser.parse_table_dependencies(config.table_dependencies_file)
         progress_tracker.update()
 
-        object_dep_parser = DependencyParser(config)
-        object_dependencies = object_dep_parser.parse_object_dependencies(config.object_dependencies_file)
+        object_dependencies = dependency_parser.parse_object_dependencies(config.object_dependencies_file)
         progress_tracker.update()
 
     print(f"Loaded {len(tables)} tables, {len(objects)} objects")
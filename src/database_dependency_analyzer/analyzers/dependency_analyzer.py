@@ -2,12 +2,12 @@
 
 import logging
 import time
-from collections import defaultdict
-from typing import Dict, List, Set
+from collections import Counter, defaultdict, deque
+from typing import Dict, List, Set, Union
 
 from ..models.analysis_result import AnalysisResult, AnalysisStatistics
 from ..models.config import AnalysisConfig
-from ..models.dependency import TableDependency, ObjectDependency
+from ..models.dependency import DependencyArrays, TableDependency, ObjectDependency
 from ..models.object import DatabaseObject
 from ..models.table import Table, ObjectReference
 
@@ -30,15 +30,15 @@ class DependencyAnalyzer:
     
     def analyze(self, tables: Dict[int, Table], 
                 objects: Dict[int, DatabaseObject], 
-                table_dependencies: List[TableDependency], 
-                object_dependencies: List[ObjectDependency]) -> AnalysisResult:
+                table_dependencies: Union[List[TableDependency], DependencyArrays], 
+                object_dependencies: Union[List[ObjectDependency], DependencyArrays]) -> AnalysisResult:
         """Perform dependency analysis and return results.
         
         Args:
             tables: Dictionary of tables by ID
             objects: Dictionary of database objects by ID
-            table_dependencies: List of table dependency relationships
-            object_dependencies: List of object dependency relationships
+            table_dependencies: Table dependency relationships, as records or column arrays
+            object_dependencies: Object dependency relationships, as records or column arrays
             
         Returns:
             AnalysisResult containing the complete analysis findings
@@ -76,76 +76,93 @@ class DependencyAnalyzer:
     
     def _build_dependency_graph(self, tables: Dict[int, Table], 
                                objects: Dict[int, DatabaseObject], 
-                               table_dependencies: List[TableDependency], 
-                               object_dependencies: List[ObjectDependency]) -> Dict:
+                               table_dependencies: Union[List[TableDependency], DependencyArrays], 
+                               object_dependencies: Union[List[ObjectDependency], DependencyArrays]) -> Dict:
         """Build a comprehensive dependency graph.
         
         Args:
             tables: Dictionary of tables by ID
             objects: Dictionary of database objects by ID
-            table_dependencies: List of table dependency relationships
-            object_dependencies: List of object dependency relationships
+            table_dependencies: Table dependency relationships, as records or column arrays
+            object_dependencies: Object dependency relationships, as records or column arrays
             
         Returns:
             Dictionary containing the dependency graph with:
             - 'tables': Updated tables with references
             - 'objects': All objects
             - 'object_deps': Object-to-object dependencies
-            - 'active_table_deps': Active table dependencies by table ID
+            - 'object_tables': Object-to-table dependencies
+            - 'active_table_deps': Active (object_id, table_id) pairs
         """
         # Create working copies to avoid modifying originals
         tables_copy = {table_id: table for table_id, table in tables.items()}
         objects_copy = {obj_id: obj for obj_id, obj in objects.items()}
         
-        # Filter active dependencies
-        active_table_deps = [
-            dep for dep in table_dependencies if dep.active
-        ]
-        active_object_deps = [
-            dep for dep in object_dependencies if dep.active
-        ]
-        
-        # Build object-to-table mapping
-        object_to_tables: Dict[int, List[int]] = defaultdict(list)
-        for dep in active_table_deps:
-            object_to_tables[dep.object_id].append(dep.table_id)
+        # Filter active dependencies down to (source, target) ID pairs
+        if isinstance(table_dependencies, DependencyArrays):
+            active_table_deps = list(table_dependencies.active_edges())
+        else:
+            active_table_deps = [
+                (dep.object_id, dep.table_id) for dep in table_dependencies if dep.active
+            ]
+        if isinstance(object_dependencies, DependencyArrays):
+            active_object_deps = list(object_dependencies.active_edges())
+        else:
+            active_object_deps = [
+                (dep.source_object_id, dep.target_object_id)
+                for dep in object_dependencies if dep.active
+            ]
+        
+        # Build object-to-table and table-to-objects mappings in one pass
+        object_to_tables: Dict[int, Set[int]] = defaultdict(set)
+        table_to_objects: Dict[int, List[int]] = defaultdict(list)
+        for object_id, table_id in active_table_deps:
+            object_to_tables[object_id].add(table_id)
+            table_to_objects[table_id].append(object_id)
         
         # Build object-to-object mapping
         object_to_objects: Dict[int, List[int]] = defaultdict(list)
-        for dep in active_object_deps:
-            object_to_objects[dep.source_object_id].append(dep.target_object_id)
+        for source_id, target_id in active_object_deps:
+            object_to_objects[source_id].append(target_id)
         
-        # Build table-to-objects mapping for quick lookup
-        table_to_objects: Dict[int, List[int]] = defaultdict(list)
-        for dep in active_table_deps:
-            table_to_objects[dep.table_id].append(dep.object_id)
+        # One shared ObjectReference per object: every reference built here is
+        # active and derived from the object, so identical refs are interned
+        ref_cache: Dict[int, ObjectReference] = {}
         
-        # Add references to tables
+        # Add references to tables, collecting each table's references in one
+        # pass and building its new instance once
         for table_id, referencing_object_ids in table_to_objects.items():
-            if table_id in tables_copy:
-                table = tables_copy[table_id]
-                for obj_id in referencing_object_ids:
-                    if obj_id in objects_copy:
-                        obj = objects_copy[obj_id]
-                        ref = ObjectReference(
-                            object_id=obj.object_id,
-                            object_name=obj.object_name,
-                            object_type=obj.object_type,
-                            active=True
-                        )
-                        # Create new table instance with updated references
-                        new_table = Table(
-                            table_id=table.table_id,
-                            table_name=table.table_name,
-                            is_used=table.is_used,
-                            referencing_objects=table.referencing_objects + [ref]
-                        )
-                        tables_copy[table_id] = new_table
+            table = tables_copy.get(table_id)
+            if table is None:
+                continue
+            refs = []
+            # Like Table.add_reference, keep one reference per object
+            for obj_id in dict.fromkeys(referencing_object_ids):
+                ref = ref_cache.get(obj_id)
+                if ref is None:
+                    obj = objects_copy.get(obj_id)
+                    if obj is None:
+                        continue
+                    # Inputs are already validated models, so skip re-validation
+                    ref = ObjectReference._unchecked(
+                        obj.object_id, obj.object_name, obj.object_type, True
+                    )
+                    ref_cache[obj_id] = ref
+                refs.append(ref)
+            if refs:
+                # Create new table instance with updated references
+                tables_copy[table_id] = Table._unchecked(
+                    table.table_id,
+                    table.table_name,
+                    table.is_used,
+                    table.referencing_objects + refs
+                )
         
         return {
             'tables': tables_copy,
             'objects': objects_copy,
             'object_deps': object_to_objects,
+            'object_tables': object_to_tables,
             'active_table_deps': active_table_deps
         }
     
@@ -157,78 +174,75 @@ class DependencyAnalyzer:
         """
         tables = dependency_graph['tables']
         object_deps = dependency_graph['object_deps']
+        object_tables = dependency_graph['object_tables']
         active_table_deps = dependency_graph['active_table_deps']
         
         # Step 1: Mark tables with direct active dependencies
-        directly_used_table_ids = {dep.table_id for dep in active_table_deps}
+        directly_used_table_ids = {table_id for _, table_id in active_table_deps}
         
         # Step 2: Handle transitive dependencies through object chains
         indirectly_used_table_ids = self._find_indirectly_used_tables(
-            directly_used_table_ids, object_deps, active_table_deps
+            directly_used_table_ids, object_deps, object_tables
         )
         
         # Step 3: Mark all used tables
         all_used_table_ids = directly_used_table_ids | indirectly_used_table_ids
         
-        for table_id, table in tables.items():
-            if table_id in all_used_table_ids:
-                if not table.is_used:
-                    # Create new table instance with updated usage status
-                    new_table = Table(
-                        table_id=table.table_id,
-                        table_name=table.table_name,
-                        is_used=True,
-                        referencing_objects=table.referencing_objects
-                    )
-                    tables[table_id] = new_table
+        # Visit only used IDs that are known tables; rebinding existing keys
+        # keeps the dict's order
+        for table_id in tables.keys() & all_used_table_ids:
+            table = tables[table_id]
+            if not table.is_used:
+                # Create new table instance with updated usage status
+                new_table = Table._unchecked(
+                    table.table_id,
+                    table.table_name,
+                    True,
+                    table.referencing_objects
+                )
+                tables[table_id] = new_table
     
     def _find_indirectly_used_tables(self, directly_used_table_ids: Set[int], 
                                     object_deps: Dict[int, List[int]], 
-                                    active_table_deps: List[TableDependency]) -> Set[int]:
+                                    object_tables: Dict[int, Set[int]]) -> Set[int]:
         """Find tables that are used indirectly through object dependency chains.
         
         Args:
             directly_used_table_ids: IDs of tables with direct dependencies
             object_deps: Object-to-object dependency mapping
-            active_table_deps: Active table dependencies
+            object_tables: Object-to-table dependency mapping
             
         Returns:
             Set of table IDs that are used indirectly
         """
         indirectly_used = set()
         
-        # Build object-to-table mapping for quick lookup
-        object_to_tables = defaultdict(set)
-        for dep in active_table_deps:
-            object_to_tables[dep.object_id].add(dep.table_id)
-        
         # For each object that references a directly used table,
-        # find all objects that depend on it (transitively)
-        visited_objects = set()
-        
-        # Find objects that directly reference used tables
-        seed_objects = set()
-        for dep in active_table_deps:
-            if dep.table_id in directly_used_table_ids:
-                seed_objects.add(dep.object_id)
+        # find all objects that depend on it (transitively).
+        # Objects are marked visited when queued, so each is queued once.
+        visited_objects = {
+            object_id for object_id, table_ids in object_tables.items()
+            if not table_ids.isdisjoint(directly_used_table_ids)
+        }
         
         # Perform BFS to find all objects in dependency chains
-        queue = list(seed_objects)
+        queue = deque(visited_objects)
+        popleft, append, visit = queue.popleft, queue.append, visited_objects.add
+        get_tables, get_dependents = object_tables.get, object_deps.get
+        add_tables = indirectly_used.update
+        empty: Set[int] = set()
         
         while queue:
-            current_obj_id = queue.pop(0)
-            if current_obj_id in visited_objects:
-                continue
-            
-            visited_objects.add(current_obj_id)
+            current_obj_id = popleft()
             
             # Add tables referenced by this object
-            indirectly_used.update(object_to_tables.get(current_obj_id, set()))
+            add_tables(get_tables(current_obj_id, empty))
             
             # Add objects that depend on this object
-            for dependent_obj_id in object_deps.get(current_obj_id, []):
+            for dependent_obj_id in get_dependents(current_obj_id, ()):
                 if dependent_obj_id not in visited_objects:
-                    queue.append(dependent_obj_id)
+                    visit(dependent_obj_id)
+                    append(dependent_obj_id)
         
         # Remove directly used tables from the result
         return indirectly_used - directly_used_table_ids
@@ -247,22 +261,19 @@ class DependencyAnalyzer:
         active_table_deps = dependency_graph['active_table_deps']
         
         total_tables = len(tables)
-        used_tables = sum(1 for table in tables.values() if table.is_used)
-        unused_tables = total_tables - used_tables
-        
         total_objects = len(objects)
-        object_type_distribution: Dict[str, int] = {}
-        for obj in objects.values():
-            obj_type = obj.object_type
-            object_type_distribution[obj_type] = object_type_distribution.get(obj_type, 0) + 1
-        
-        # Get unused table IDs
-        unused_table_ids = [table.table_id for table in tables.values() if not table.is_used]
+        object_type_distribution: Dict[str, int] = dict(
+            Counter(obj.object_type for obj in objects.values())
+        )
         
-        # Find most referenced table
+        # Collect unused table IDs and find the most referenced table in
+        # a single pass over the tables
+        unused_table_ids = []
         most_referenced_table = None
         max_refs = 0
         for table in tables.values():
+            if not table.is_used:
+                unused_table_ids.append(table.table_id)
             ref_count = len(table.referencing_objects)
             if ref_count > max_refs:
                 max_refs = ref_count
@@ -272,6 +283,9 @@ class DependencyAnalyzer:
                     "reference_count": ref_count
                 }
         
+        unused_tables = len(unused_table_ids)
+        used_tables = total_tables - unused_tables
+        
         total_dependencies = len(active_table_deps)
         active_dependencies = len(active_table_deps)
         
@@ -1,5 +1,6 @@
 """Statistics calculator for dependency analysis."""
 
+from collections import Counter
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Any, Union
 
@@ -46,10 +47,9 @@ class StatisticsCalculator:
         unused_table_ids = [t.table_id for t in tables.values() if not t.is_used]
 
         # Calculate object type distribution
-        object_type_distribution: Dict[str, int] = {}
-        for obj in objects.values():
-            obj_type = obj.object_type
-            object_type_distribution[obj_type] = object_type_distribution.get(obj_type, 0) + 1
+        object_type_distribution: Dict[str, int] = dict(
+            Counter(obj.object_type for obj in objects.values())
+        )
 
         total_objects = len(objects)
 
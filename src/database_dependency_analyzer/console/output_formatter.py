@@ -6,6 +6,13 @@ from typing import Dict, List
 from ..models.analysis_result import AnalysisResult, AnalysisStatistics
 from ..models.table import Table
 
+# Default progress bar width, and the bar for every fill level at that width
+_PROGRESS_BAR_WIDTH = 20
+_PROGRESS_BARS = tuple(
+    "[" + "=" * filled + " " * (_PROGRESS_BAR_WIDTH - filled) + "]"
+    for filled in range(_PROGRESS_BAR_WIDTH + 1)
+)
+
 
 class OutputFormatter:
     """Formats analysis results for console output.
@@ -208,13 +215,12 @@ class OutputFormatter:
         percentage = (current / total * 100) if total > 0 else 0
         progress_bar = self._create_progress_bar(current, total)
 
-        parts = [f"[{progress_bar}] {percentage:.1f}%"]
         if message:
-            parts.append(message)
-
-        return " ".join(parts)
+            return f"[{progress_bar}] {percentage:.1f}% {message}"
+        return f"[{progress_bar}] {percentage:.1f}%"
 
-    def _create_progress_bar(self, current: int, total: int, width: int = 20) -> str:
+    def _create_progress_bar(self, current: int, total: int,
+                             width: int = _PROGRESS_BAR_WIDTH) -> str:
         """Create a simple text-based progress bar.
 
         Args:
@@ -229,5 +235,7 @@ class OutputFormatter:
             return "=" * width
 
         filled = int(width * current / total)
+        if width == _PROGRESS_BAR_WIDTH and 0 <= filled <= width:
+            return _PROGRESS_BARS[filled]
         bar = "=" * filled + " " * (width - filled)
         return f"[{bar}]"
\ No newline at end of file
@@ -4,10 +4,17 @@ import logging
 import sys
 import time
 from contextlib import contextmanager
-from typing import Optional
+from typing import List, Optional
 
 from tqdm import tqdm
 
+# show_message prefixes by level; other levels print the bare message
+_MESSAGE_PREFIXES = {
+    "info": "ℹ️  ",
+    "warning": "⚠️  ",
+    "error": "❌ ",
+}
+
 
 class ProgressTracker:
     """Tracks and displays progress for long-running operations.
@@ -16,18 +23,26 @@ class ProgressTracker:
     console output and supports nested progress tracking for complex operations.
     """
 
-    def __init__(self, enabled: bool = True, verbose: bool = False):
+    def __init__(self, enabled: bool = True, verbose: bool = False,
+                 log_interval: float = 0.1):
         """Initialize the progress tracker.
 
         Args:
             enabled: Whether progress tracking is enabled.
             verbose: Whether to enable verbose output.
+            log_interval: Minimum seconds between log_progress messages;
+                the final message of an operation is always logged.
         """
         self.enabled = enabled
         self.verbose = verbose
+        self.log_interval = log_interval
+        self._last_log_time: Optional[float] = None
         self.logger = logging.getLogger(__name__)
         self._current_progress: Optional[tqdm] = None
         self._start_time = 0.0
+        self._total = 0
+        # Completed-stage lines from step(), written out by finish_operation
+        self._step_lines: List[str] = []
 
     def start_operation(self, total: int, description: str = "Processing") -> Optional[tqdm]:
         """Start tracking progress for an operation.
@@ -43,6 +58,8 @@ class ProgressTracker:
             return None
 
         self._start_time = time.time()
+        self._total = total
+        self._step_lines = []
 
         # Disable tqdm if output is redirected or not a tty
         disable = not sys.stdout.isatty()
@@ -67,6 +84,22 @@ class ProgressTracker:
         if self._current_progress:
             self._current_progress.update(n)
 
+    def step(self, name: str) -> None:
+        """Record a completed stage of the current operation.
+
+        Advances progress by one and buffers a ``[done/total] name`` line.
+        The buffered lines are written to stderr in a single write when the
+        operation finishes, instead of printing once per stage.
+
+        Args:
+            name: Description of the completed stage.
+        """
+        if not self.enabled:
+            return
+
+        self.update()
+        self._step_lines.append(f"[{len(self._step_lines) + 1}/{self._total}] {name}\n")
+
     def set_description(self, description: str) -> None:
         """Update the progress bar description.
 
@@ -86,6 +119,11 @@ class ProgressTracker:
             self._current_progress.close()
             self._current_progress = None
 
+        if self._step_lines:
+            sys.stderr.write("".join(self._step_lines))
+            sys.stderr.flush()
+            self._step_lines = []
+
         elapsed = time.time() - self._start_time
         self._start_time = 0.0
 
@@ -119,8 +157,15 @@ class ProgressTracker:
             total: Total progress value.
             message: Optional message.
         """
-        if not self.enabled:
+        if not self.enabled or not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        # Rate-limit intermediate messages so per-item calls stay cheap
+        now = time.monotonic()
+        if (current < total and self._last_log_time is not None
+                and now - self._last_log_time < self.log_interval):
             return
+        self._last_log_time = now
 
         percentage = (current / total * 100) if total > 0 else 0
 
@@ -142,7 +187,8 @@ class ProgressTracker:
         """
         return ProgressTracker(
             enabled=self.enabled,
-            verbose=self.verbose
+            verbose=self.verbose,
+            log_interval=self.log_interval
         )
 
     def show_message(self, message: str, level: str = "info") -> None:
@@ -159,14 +205,7 @@ class ProgressTracker:
         if self._current_progress:
             self._current_progress.clear()
 
-        if level == "info":
-            print(f"ℹ️  {message}")
-        elif level == "warning":
-            print(f"⚠️  {message}")
-        elif level == "error":
-            print(f"❌ {message}")
-        else:
-            print(message)
+        print(_MESSAGE_PREFIXES.get(level, "") + message)
 
         # Refresh progress bar
         if self._current_progress:
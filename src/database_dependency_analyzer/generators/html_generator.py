@@ -1,11 +1,32 @@
 """HTML report generator for database dependency analysis results."""
 
+import html
 import json
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from ..models.analysis_result import AnalysisResult
 
+# Node fill colors by node type. Emitted into the embedded script as
+# DIAGRAM_NODE_COLORS so both diagram renderers use the same palette
+_DIAGRAM_NODE_COLORS = {
+    'table': '#2563eb',
+    'form': '#3b82f6',
+    'query': '#f59e0b',
+    'macro': '#dc2626',
+    'report': '#16a34a'
+}
+
+# Object node columns in drawing order: (object type, diagram filter key,
+# x position). Emitted into the embedded script as DIAGRAM_OBJECT_COLUMNS so
+# the server-rendered diagram and the script's redraws share one mapping
+_DIAGRAM_OBJECT_COLUMNS = [
+    ('Form', 'forms', 350),
+    ('Query', 'queries', 500),
+    ('Macro', 'macros', 650),
+    ('Report', 'reports', 800)
+]
+
 
 class HTMLGenerator:
     """Generates self-contained HTML reports for database dependency analysis.
@@ -130,11 +151,22 @@ class HTMLGenerator:
     </div>
 
     <script type="application/json" id="analysis-data">
-{json.dumps(embedded_data, indent=2)}
+{self._serialize_json(embedded_data)}
     </script>
 </body>
 </html>"""
 
+    def _serialize_json(self, embedded_data: Dict[str, Any]) -> str:
+        """Serialize embedded data as compact JSON safe for a script block.
+
+        Args:
+            embedded_data: Serialized analysis data for embedding.
+
+        Returns:
+            JSON string with no indentation and ``</`` escaped.
+        """
+        return json.dumps(embedded_data, separators=(',', ':')).replace('</', '<\\/')
+
     def _generate_header(self) -> str:
         """Generate the report header section.
 
@@ -293,20 +325,22 @@ class HTMLGenerator:
 
             <!-- Table View -->
             <div id="table-view" class="view-container active">
-                <table class="dependencies-table">
-                    <thead>
-                        <tr>
-                            <th>Status</th>
-                            <th>Table Name</th>
-                            <th>References</th>
-                            <th>Object Types</th>
-                            <th>Details</th>
-                        </tr>
-                    </thead>
-                    <tbody id="table-body">
-                        <!-- Table rows will be inserted here -->
-                    </tbody>
-                </table>
+                <div id="table-scroll" class="table-scroll">
+                    <table class="dependencies-table">
+                        <thead>
+                            <tr>
+                                <th>Status</th>
+                                <th>Table Name</th>
+                                <th>References</th>
+                                <th>Object Types</th>
+                                <th>Details</th>
+                            </tr>
+                        </thead>
+                        <tbody id="table-body">
+                            <!-- Visible table rows will be inserted here -->
+                        </tbody>
+                    </table>
+                </div>
             </div>
 
             <!-- Card View -->
@@ -350,22 +384,108 @@ class HTMLGenerator:
         Returns:
             HTML dependency diagram section as string.
         """
-        return '''
+        object_filters = ''.join(
+            f'''
+                    <label><input type="checkbox" id="show-{filter_key}" checked> {filter_key.capitalize()}</label>'''
+            for _, filter_key, _ in _DIAGRAM_OBJECT_COLUMNS
+        )
+        return f'''
             <section class="dependency-diagram-section">
                 <h2>Table Dependency Diagram</h2>
                 <div class="diagram-controls">
-                    <label><input type="checkbox" id="show-tables" checked> Tables</label>
-                    <label><input type="checkbox" id="show-forms" checked> Forms</label>
-                    <label><input type="checkbox" id="show-queries" checked> Queries</label>
-                    <label><input type="checkbox" id="show-macros" checked> Macros</label>
-                    <label><input type="checkbox" id="show-reports" checked> Reports</label>
+                    <label><input type="checkbox" id="show-tables" checked> Tables</label>{object_filters}
                 </div>
                 <div id="dependency-diagram" class="dependency-diagram">
-                    <!-- SVG diagram rendered here -->
+                    {self._render_diagram_svg()}
                 </div>
             </section>
         '''
 
+    def _render_diagram_svg(self) -> str:
+        """Render the dependency diagram with all node types shown.
+
+        This is the diagram the page opens with, so the browser only has to
+        parse it; the script redraws it only when a filter checkbox changes.
+        The layout mirrors buildDiagramNodes in the embedded script; both
+        place object nodes from _DIAGRAM_OBJECT_COLUMNS.
+
+        Returns:
+            SVG markup, or a placeholder message when there are no nodes.
+        """
+        nodes: List[Dict[str, Any]] = []
+        y_offset = 30
+
+        def add_node(node_id: str, label: str, node_type: str, status: str, x: int) -> None:
+            display = label[:14] + '\u2026' if len(label) > 15 else label
+            nodes.append({
+                'id': node_id,
+                'label': html.escape(display),
+                'width': max(100, len(label) * 8),
+                'type': node_type,
+                'status': status,
+                'x': x,
+                'y': y_offset
+            })
+
+        tables = self.analysis_result.tables.values()
+        for table in tables:
+            add_node(f"table-{table.table_id}", table.table_name, 'table',
+                     'used' if table.is_used else 'unused', 100)
+            y_offset += 50
+
+        objects = self.analysis_result.objects.values()
+        for obj_type, _, x in _DIAGRAM_OBJECT_COLUMNS:
+            type_key = obj_type.lower()
+            for obj in objects:
+                if obj.object_type == obj_type:
+                    add_node(f"{type_key}-{obj.object_id}", obj.object_name, type_key, 'active', x)
+                    y_offset += 40
+
+        if not nodes:
+            return '<p class="no-data-message">No dependencies to display.</p>'
+
+        nodes_by_id = {node['id']: node for node in nodes}
+        parts = []
+
+        # Draw links first (behind nodes)
+        for table in tables:
+            source = nodes_by_id.get(f"table-{table.table_id}")
+            if source is None:
+                continue
+            for ref in table.referencing_objects:
+                target = nodes_by_id.get(f"{ref.object_type.lower()}-{ref.object_id}")
+                if target is None:
+                    continue
+                if ref.active:
+                    stroke, cls = '#16a34a', 'diagram-link active'
+                else:
+                    stroke, cls = '#dc2626', 'diagram-link inactive'
+                parts.append(
+                    f'<line x1="{source["x"]}" y1="{source["y"]}" x2="{target["x"]}" y2="{target["y"]}" '
+                    f'stroke="{stroke}" stroke-width="2" class="{cls}"/>'
+                )
+
+        # Draw nodes
+        for node in nodes:
+            width = node['width']
+            border = ' stroke="#dc2626" stroke-width="2"' if node['status'] == 'unused' else ''
+            color = _DIAGRAM_NODE_COLORS.get(node['type'], '#6b7280')
+            parts.append(
+                '<g class="diagram-node">'
+                f'<rect x="{node["x"] - width // 2}" y="{node["y"] - 12}" width="{width}" height="24" '
+                f'rx="4" fill="{color}"{border}/>'
+                f'<text x="{node["x"]}" y="{node["y"] + 4}" text-anchor="middle" fill="white" '
+                f'font-size="11" font-weight="500">{node["label"]}</text>'
+                '</g>'
+            )
+
+        width = 900
+        height = max(250, len(nodes) * 45 + 60)
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}">{"".join(parts)}</svg>'
+        )
+
     def _generate_embedded_css(self) -> str:
         """Generate embedded CSS styles for the report.
 
@@ -809,6 +929,22 @@ body {
     color: #374151;
 }
 
+/* Virtualized table body: rows need a fixed height for windowing */
+.table-scroll {
+    max-height: 70vh;
+    overflow-y: auto;
+}
+
+.dependencies-table tbody tr {
+    height: 64px;
+    white-space: nowrap;
+}
+
+.dependencies-table tbody tr.spacer-row td {
+    padding: 0;
+    border: none;
+}
+
 .table-status {
     display: inline-block;
     padding: 0.25rem 0.75rem;
@@ -1368,6 +1504,23 @@ body {
         // Placeholder for interactive functionality
         // This will be implemented in a future phase
 
+        const HTML_ESC = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+        const escapeHtml = s => String(s).replace(/[&<>"']/g, c => HTML_ESC[c]);
+
+        const SVG_NS = 'http://www.w3.org/2000/svg';
+        // Older engines do not implement innerHTML on SVG elements
+        const SVG_SUPPORTS_INNER_HTML = typeof SVGElement !== 'undefined' && 'innerHTML' in SVGElement.prototype;
+
+        // Node fill colors by node type, from _DIAGRAM_NODE_COLORS
+        const DIAGRAM_NODE_COLORS = __DIAGRAM_NODE_COLORS__;
+
+        // Object node columns: {type, filter, x}, from _DIAGRAM_OBJECT_COLUMNS
+        const DIAGRAM_OBJECT_COLUMNS = __DIAGRAM_OBJECT_COLUMNS__;
+
+        // Must match the tbody row height in the embedded CSS
+        const ROW_HEIGHT = 64;
+        const ROW_OVERSCAN = 10;
+
         class ReportController {
             constructor() {
                 this.data = null;
@@ -1379,9 +1532,15 @@ body {
                     sortBy: 'name'
                 };
                 this.currentView = 'table';
-
-                this.initializeEventListeners();
-                this.loadData();
+                this.visibleTables = [];
+                this.renderedRange = null;
+                this.chartKey = null;
+
+                // Every handler reads this.data, so attach them only once the
+                // worker has delivered it
+                this.ready = this.loadData().then(() => {
+                    if (this.data) this.initializeEventListeners();
+                });
             }
 
             initializeEventListeners() {
@@ -1435,35 +1594,150 @@ body {
                 document.getElementById('export-btn').addEventListener('click', () => {
                     this.exportToCSV();
                 });
+
+                // Windowed table rendering, throttled to one update per frame
+                let scrollScheduled = false;
+                document.getElementById('table-scroll').addEventListener('scroll', () => {
+                    if (scrollScheduled) return;
+                    scrollScheduled = true;
+                    requestAnimationFrame(() => {
+                        scrollScheduled = false;
+                        this.renderVisibleRows();
+                    });
+                });
             }
 
             loadData() {
                 // Load embedded data
                 const dataElement = document.getElementById('analysis-data');
-                if (dataElement) {
-                    this.data = JSON.parse(dataElement.textContent);
+                if (!dataElement) return Promise.resolve();
+
+                return this.parseData(dataElement.textContent).then(data => {
+                    this.data = data;
+                    this.prepareData();
                     this.renderReport();
-                }
+                }).catch(error => {
+                    // Leave the controls detached and say so instead of
+                    // showing an empty report
+                    console.error('Could not load report data:', error);
+                    this.data = null;
+                    this.renderLoadError();
+                });
+            }
+
+            renderLoadError() {
+                const tbody = document.getElementById('table-body');
+                if (!tbody) return;
+                tbody.innerHTML = '<tr><td colspan="5" class="no-data-message">Report data could not be loaded.</td></tr>';
+            }
+
+            parseData(text) {
+                // Parse on a worker so large reports do not block first paint
+                return new Promise((resolve, reject) => {
+                    // Fallback when no worker can parse: a parse error must
+                    // reject, or the promise would never settle
+                    const parseHere = () => {
+                        try {
+                            resolve(JSON.parse(text));
+                        } catch (e) {
+                            reject(e);
+                        }
+                    };
+                    let worker;
+                    let url;
+                    try {
+                        url = URL.createObjectURL(new Blob(
+                            ['onmessage = e => postMessage(JSON.parse(e.data));'],
+                            { type: 'application/javascript' }
+                        ));
+                        worker = new Worker(url);
+                    } catch (e) {
+                        if (url) URL.revokeObjectURL(url);
+                        parseHere();
+                        return;
+                    }
+
+                    const cleanup = () => {
+                        worker.terminate();
+                        URL.revokeObjectURL(url);
+                    };
+                    worker.onmessage = e => {
+                        cleanup();
+                        resolve(e.data);
+                    };
+                    worker.onerror = () => {
+                        cleanup();
+                        parseHere();
+                    };
+                    worker.postMessage(text);
+                });
+            }
+
+            prepareData() {
+                // Escape user-supplied names once so templates can interpolate them directly
+                Object.values(this.data.tables).forEach(table => {
+                    table._nameEsc = escapeHtml(table.table_name);
+                    table._typeCounts = {};
+                    table.referencing_objects.forEach(obj => {
+                        obj._nameEsc = escapeHtml(obj.object_name);
+                        table._typeCounts[obj.object_type] = (table._typeCounts[obj.object_type] || 0) + 1;
+                    });
+                });
+                Object.values(this.data.objects).forEach(obj => {
+                    obj._nameEsc = escapeHtml(obj.object_name);
+                });
             }
 
             renderReport() {
                 this.renderTableView();
-                this.renderUsageChart();
                 this.updateStats();
                 console.log('Report rendered with', Object.keys(this.data.tables).length, 'tables');
             }
 
             renderTableView(tables = null) {
+                const scroller = document.getElementById('table-scroll');
+                if (!scroller) return;
+
+                this.visibleTables = tables || Object.values(this.data.tables);
+                this.renderedRange = null;
+                scroller.scrollTop = 0;
+                this.renderVisibleRows();
+            }
+
+            renderVisibleRows() {
+                // Only rows in the viewport (plus overscan) are in the DOM;
+                // spacer rows keep the scrollbar length for the full list.
                 const tbody = document.getElementById('table-body');
-                if (!tbody) return;
+                const scroller = document.getElementById('table-scroll');
+                if (!tbody || !scroller) return;
+
+                const total = this.visibleTables.length;
+                const first = Math.min(total, Math.floor(scroller.scrollTop / ROW_HEIGHT));
+                const last = Math.min(total, first + Math.ceil(scroller.clientHeight / ROW_HEIGHT) + ROW_OVERSCAN);
+
+                const range = `${first}:${last}`;
+                if (range === this.renderedRange) return;
+                this.renderedRange = range;
+
+                const fragment = document.createDocumentFragment();
+                fragment.appendChild(this.createSpacerRow(first * ROW_HEIGHT));
+                for (let i = first; i < last; i++) {
+                    fragment.appendChild(this.createTableRow(this.visibleTables[i]));
+                }
+                fragment.appendChild(this.createSpacerRow((total - last) * ROW_HEIGHT));
 
-                const tablesToRender = tables || Object.values(this.data.tables);
                 tbody.innerHTML = '';
+                tbody.appendChild(fragment);
+            }
 
-                tablesToRender.forEach(table => {
-                    const row = this.createTableRow(table);
-                    tbody.appendChild(row);
-                });
+            createSpacerRow(height) {
+                const row = document.createElement('tr');
+                row.className = 'spacer-row';
+                row.style.height = `${height}px`;
+                const cell = document.createElement('td');
+                cell.colSpan = 5;
+                row.appendChild(cell);
+                return row;
             }
 
             createTableRow(table) {
@@ -1487,10 +1761,7 @@ body {
 
                 // Types cell
                 const typesCell = document.createElement('td');
-                const typeCounts = {};
-                table.referencing_objects.forEach(obj => {
-                    typeCounts[obj.object_type] = (typeCounts[obj.object_type] || 0) + 1;
-                });
+                const typeCounts = table._typeCounts;
 
                 Object.entries(typeCounts).forEach(([type, count]) => {
                     const badge = document.createElement('span');
@@ -1518,14 +1789,16 @@ body {
                 return row;
             }
 
-            renderUsageChart(tables = null) {
+            renderUsageChart(totalTables, usedCount) {
                 const canvas = document.getElementById('usage-chart');
                 if (!canvas) return;
 
+                // Only redraw when the used/unused split actually changes
+                const chartKey = `${usedCount}/${totalTables}`;
+                if (chartKey === this.chartKey) return;
+                this.chartKey = chartKey;
+
                 const ctx = canvas.getContext('2d');
-                const tablesToChart = tables || Object.values(this.data.tables);
-                const totalTables = tablesToChart.length;
-                const usedCount = tablesToChart.filter(t => t.is_used).length;
                 const usedPercent = totalTables > 0 ? (usedCount / totalTables) * 100 : 0;
                 const unusedPercent = 100 - usedPercent;
 
@@ -1567,7 +1840,7 @@ body {
                 modal.innerHTML = `
                     <div class="modal-content">
                         <div class="modal-header">
-                            <h2>Table Details: ${table.table_name}</h2>
+                            <h2>Table Details: ${table._nameEsc}</h2>
                             <button class="modal-close">&times;</button>
                         </div>
                         <div class="modal-body">
@@ -1583,7 +1856,7 @@ body {
                                     ${table.referencing_objects.map(obj => `
                                         <div class="reference-item">
                                             <span class="object-icon ${obj.object_type.toLowerCase()}">${this.getObjectIcon(obj.object_type)}</span>
-                                            <span class="object-name">${obj.object_name}</span>
+                                            <span class="object-name">${obj._nameEsc}</span>
                                             <span class="object-type">${obj.object_type}</span>
                                             <span class="object-status ${obj.active ? 'active' : 'inactive'}">${obj.active ? 'Active' : 'Inactive'}</span>
                                         </div>
@@ -1622,18 +1895,15 @@ body {
                 const filteredTables = this.filterTables();
                 const sortedTables = this.sortTables(filteredTables);
 
-                // CSV header
-                let csv = 'Table Name,Status,References,Object Types\n';
+                // CSV header; rows are collected and joined once at the end
+                const lines = ['Table Name,Status,References,Object Types'];
 
                 // CSV rows
                 sortedTables.forEach(table => {
                     const status = table.is_used ? 'Used' : 'Unused';
                     const refs = table.referencing_objects.length;
 
-                    const typeCounts = {};
-                    table.referencing_objects.forEach(obj => {
-                        typeCounts[obj.object_type] = (typeCounts[obj.object_type] || 0) + 1;
-                    });
+                    const typeCounts = table._typeCounts;
 
                     const types = Object.entries(typeCounts)
                         .map(([type, count]) => `${type}:${count}`)
@@ -1642,10 +1912,11 @@ body {
                     // Escape commas and quotes in table name
                     const escapedName = table.table_name.replace(/"/g, '""');
 
-                    csv += `"${escapedName}",${status},${refs},"${types}"\n`;
+                    lines.push(`"${escapedName}",${status},${refs},"${types}"`);
                 });
 
                 // Download CSV
+                const csv = lines.join('\\n') + '\\n';
                 const blob = new Blob([csv], { type: 'text/csv;charset=utf-8;' });
                 const link = document.createElement('a');
                 const url = URL.createObjectURL(blob);
@@ -1673,19 +1944,22 @@ body {
             updateStats(filteredTables = null) {
                 const tables = filteredTables || Object.values(this.data.tables);
                 const usedCount = tables.filter(t => t.is_used).length;
-                const unusedCount = tables.filter(t => !t.is_used).length;
 
+                this.updateStatNumbers(tables.length, usedCount);
+
+                // Update sidebar chart
+                this.renderUsageChart(tables.length, usedCount);
+            }
+
+            updateStatNumbers(totalCount, usedCount) {
                 // Update header stats
                 const totalEl = document.getElementById('total-tables');
                 const usedEl = document.getElementById('used-tables');
                 const unusedEl = document.getElementById('unused-tables');
 
-                if (totalEl) totalEl.textContent = tables.length;
+                if (totalEl) totalEl.textContent = totalCount;
                 if (usedEl) usedEl.textContent = usedCount;
-                if (unusedEl) unusedEl.textContent = unusedCount;
-
-                // Update sidebar chart
-                this.renderUsageChart(tables);
+                if (unusedEl) unusedEl.textContent = totalCount - usedCount;
             }
 
             filterTables() {
@@ -1767,10 +2041,7 @@ body {
 
                 const types = document.createElement('div');
                 types.className = 'card-types';
-                const typeCounts = {};
-                table.referencing_objects.forEach(obj => {
-                    typeCounts[obj.object_type] = (typeCounts[obj.object_type] || 0) + 1;
-                });
+                const typeCounts = table._typeCounts;
 
                 Object.entries(typeCounts).forEach(([type, count]) => {
                     const badge = document.createElement('span');
@@ -1846,7 +2117,7 @@ body {
                     objectList.className = 'object-list';
                     table.referencing_objects.forEach(obj => {
                         const item = document.createElement('li');
-                        item.innerHTML = `<span class="object-type-badge ${obj.object_type.toLowerCase()}">${obj.object_type}</span> ${obj.object_name}`;
+                        item.innerHTML = `<span class="object-type-badge ${obj.object_type.toLowerCase()}">${obj.object_type}</span> ${obj._nameEsc}`;
                         objectList.appendChild(item);
                     });
                     refsCell.appendChild(objectList);
@@ -1856,10 +2127,7 @@ body {
 
                 // Object types summary column
                 const typesCell = document.createElement('td');
-                const typeCounts = {};
-                table.referencing_objects.forEach(obj => {
-                    typeCounts[obj.object_type] = (typeCounts[obj.object_type] || 0) + 1;
-                });
+                const typeCounts = table._typeCounts;
                 Object.entries(typeCounts).forEach(([type, count]) => {
                     const badge = document.createElement('span');
                     badge.className = `type-count-badge ${type.toLowerCase()}`;
@@ -1878,13 +2146,10 @@ body {
             // ========== Dependency Diagram Methods ==========
 
             initDependencyDiagram() {
-                this.diagramFilters = {
-                    tables: true,
-                    forms: true,
-                    queries: true,
-                    macros: true,
-                    reports: true
-                };
+                this.diagramFilters = { tables: true };
+                DIAGRAM_OBJECT_COLUMNS.forEach(column => {
+                    this.diagramFilters[column.filter] = true;
+                });
 
                 // Initialize filter event listeners
                 document.querySelectorAll('.diagram-controls input[type="checkbox"]').forEach(checkbox => {
@@ -1895,13 +2160,37 @@ body {
                     });
                 });
 
-                this.renderDependencyDiagram();
+                // The unfiltered diagram is rendered into the page by the
+                // generator; only redraw if the browser restored an unchecked box
+                document.querySelectorAll('.diagram-controls input[type="checkbox"]').forEach(checkbox => {
+                    this.diagramFilters[checkbox.id.replace('show-', '')] = checkbox.checked;
+                });
+                if (!Object.values(this.diagramFilters).every(Boolean)) {
+                    this.renderDependencyDiagram();
+                }
+            }
+
+            prepareDiagramLabels() {
+                // Truncated labels and box widths do not change between renders,
+                // so compute them once per table/object instead of per redraw
+                const prepare = (record, label) => {
+                    record._display = label.length > 15 ? label.substring(0, 14) + '\u2026' : label;
+                    record._displayEsc = escapeHtml(record._display);
+                    record._w = Math.max(100, label.length * 8);
+                };
+                Object.values(this.data.tables).forEach(table => prepare(table, table.table_name));
+                Object.values(this.data.objects).forEach(obj => prepare(obj, obj.object_name));
             }
 
             renderDependencyDiagram() {
                 const container = document.getElementById('dependency-diagram');
                 if (!container) return;
 
+                if (!this.diagramLabelsReady) {
+                    this.prepareDiagramLabels();
+                    this.diagramLabelsReady = true;
+                }
+
                 const nodes = this.buildDiagramNodes();
                 const links = this.buildDiagramLinks();
 
@@ -1925,6 +2214,9 @@ body {
                         nodes.push({
                             id: `table-${table.table_id}`,
                             label: table.table_name,
+                            _display: table._display,
+                            _displayEsc: table._displayEsc,
+                            _w: table._w,
                             type: 'table',
                             status: table.is_used ? 'used' : 'unused',
                             x: 100,
@@ -1935,28 +2227,20 @@ body {
                 }
 
                 // Add objects (Forms, Queries, Macros, Reports)
-                const objectTypes = ['Form', 'Query', 'Macro', 'Report'];
-                const objectXPositions = {
-                    'Form': 350,
-                    'Query': 500,
-                    'Macro': 650,
-                    'Report': 800
-                };
-
-                objectTypes.forEach(objType => {
-                    if (!this.diagramFilters[objType.toLowerCase() + 's']) return;
-
-                    const filterType = objType.toLowerCase() + 's';
-                    if (!this.diagramFilters[filterType]) return;
+                DIAGRAM_OBJECT_COLUMNS.forEach(({ type: objType, filter, x }) => {
+                    if (!this.diagramFilters[filter]) return;
 
                     Object.values(this.data.objects).forEach(obj => {
                         if (obj.object_type === objType) {
                             nodes.push({
                                 id: `${objType.toLowerCase()}-${obj.object_id}`,
                                 label: obj.object_name,
+                                _display: obj._display,
+                                _displayEsc: obj._displayEsc,
+                                _w: obj._w,
                                 type: objType.toLowerCase(),
                                 status: 'active',
-                                x: objectXPositions[objType],
+                                x: x,
                                 y: yOffset
                             });
                             yOffset += 40;
@@ -1987,41 +2271,88 @@ body {
             }
 
             createDiagramSVG(nodes, links) {
-                const svg = document.createElementNS('http://www.w3.org/2000/svg', 'svg');
+                const svg = document.createElementNS(SVG_NS, 'svg');
                 const width = 900;
                 const height = Math.max(250, nodes.length * 45 + 60);
                 svg.setAttribute('width', width.toString());
                 svg.setAttribute('height', height.toString());
                 svg.setAttribute('viewBox', `0 0 ${width} ${height}`);
 
+                const nodesById = new Map(nodes.map(node => [node.id, node]));
+                if (SVG_SUPPORTS_INNER_HTML) {
+                    // Build the markup as one string and let the browser parse it once
+                    svg.innerHTML = this.buildDiagramMarkup(nodes, links, nodesById);
+                } else {
+                    // Live SVG is touched once regardless of diagram size
+                    svg.appendChild(this.buildDiagramFragment(nodes, links, nodesById));
+                }
+                return svg;
+            }
+
+            buildDiagramMarkup(nodes, links, nodesById) {
+                const parts = [];
+
                 // Draw links first (behind nodes)
                 links.forEach(link => {
-                    const source = nodes.find(n => n.id === link.source);
-                    const target = nodes.find(n => n.id === link.target);
+                    const source = nodesById.get(link.source);
+                    const target = nodesById.get(link.target);
                     if (source && target) {
-                        const line = document.createElementNS('http://www.w3.org/2000/svg', 'line');
-                        line.setAttribute('x1', source.x.toString());
-                        line.setAttribute('y1', source.y.toString());
-                        line.setAttribute('x2', target.x.toString());
-                        line.setAttribute('y2', target.y.toString());
+                        const stroke = link.active ? '#16a34a' : '#dc2626';
+                        const cls = link.active ? 'diagram-link active' : 'diagram-link inactive';
+                        parts.push(`<line x1="${source.x}" y1="${source.y}" x2="${target.x}" y2="${target.y}" stroke="${stroke}" stroke-width="2" class="${cls}"/>`);
+                    }
+                });
+
+                // Draw nodes
+                nodes.forEach(node => {
+                    const textWidth = node._w;
+                    const border = node.status === 'unused' ? ' stroke="#dc2626" stroke-width="2"' : '';
+                    parts.push(
+                        '<g class="diagram-node">' +
+                        `<rect x="${node.x - textWidth / 2}" y="${node.y - 12}" width="${textWidth}" height="24" rx="4" fill="${this.getDiagramNodeColor(node.type)}"${border}/>` +
+                        `<text x="${node.x}" y="${node.y + 4}" text-anchor="middle" fill="white" font-size="11" font-weight="500">${node._displayEsc}</text>` +
+                        '</g>'
+                    );
+                });
+
+                return parts.join('');
+            }
+
+            buildDiagramFragment(nodes, links, nodesById) {
+                const frag = document.createDocumentFragment();
+
+                // Draw links first (behind nodes)
+                links.forEach(link => {
+                    const source = nodesById.get(link.source);
+                    const target = nodesById.get(link.target);
+                    if (source && target) {
+                        const line = document.createElementNS(SVG_NS, 'line');
+                        line.setAttribute('x1', source.x);
+                        line.setAttribute('y1', source.y);
+                        line.setAttribute('x2', target.x);
+                        line.setAttribute('y2', target.y);
                         line.setAttribute('stroke', link.active ? '#16a34a' : '#dc2626');
                         line.setAttribute('stroke-width', '2');
                         line.setAttribute('class', link.active ? 'diagram-link active' : 'diagram-link inactive');
-                        svg.appendChild(line);
+                        frag.appendChild(line);
                     }
                 });
 
                 // Draw nodes
                 nodes.forEach(node => {
-                    const g = document.createElementNS('http://www.w3.org/2000/svg', 'g');
+                    const g = document.createElementNS(SVG_NS, 'g');
                     g.setAttribute('class', 'diagram-node');
 
+                    const textWidth = node._w;
+                    const rectX = node.x - textWidth / 2;
+                    const rectY = node.y - 12;
+                    const textY = node.y + 4;
+
                     // Node rectangle
-                    const rect = document.createElementNS('http://www.w3.org/2000/svg', 'rect');
-                    const textWidth = Math.max(100, node.label.length * 8);
-                    rect.setAttribute('x', (node.x - textWidth / 2).toString());
-                    rect.setAttribute('y', (node.y - 12).toString());
-                    rect.setAttribute('width', textWidth.toString());
+                    const rect = document.createElementNS(SVG_NS, 'rect');
+                    rect.setAttribute('x', rectX);
+                    rect.setAttribute('y', rectY);
+                    rect.setAttribute('width', textWidth);
                     rect.setAttribute('height', '24');
                     rect.setAttribute('rx', '4');
                     rect.setAttribute('fill', this.getDiagramNodeColor(node.type));
@@ -2032,40 +2363,39 @@ body {
                     g.appendChild(rect);
 
                     // Node label
-                    const text = document.createElementNS('http://www.w3.org/2000/svg', 'text');
-                    text.setAttribute('x', node.x.toString());
-                    text.setAttribute('y', (node.y + 4).toString());
+                    const text = document.createElementNS(SVG_NS, 'text');
+                    text.setAttribute('x', node.x);
+                    text.setAttribute('y', textY);
                     text.setAttribute('text-anchor', 'middle');
                     text.setAttribute('fill', 'white');
                     text.setAttribute('font-size', '11');
                     text.setAttribute('font-weight', '500');
-                    text.textContent = node.label.length > 15 ? node.label.substring(0, 14) + '…' : node.label;
+                    text.textContent = node._display;
                     g.appendChild(text);
 
-                    svg.appendChild(g);
+                    frag.appendChild(g);
                 });
 
-                return svg;
+                return frag;
             }
 
             getDiagramNodeColor(type) {
-                const colors = {
-                    'table': '#2563eb',
-                    'form': '#3b82f6',
-                    'query': '#f59e0b',
-                    'macro': '#dc2626',
-                    'report': '#16a34a'
-                };
-                return colors[type] || '#6b7280';
+                return DIAGRAM_NODE_COLORS[type] || '#6b7280';
             }
         }
 
         // Initialize when DOM is loaded
         document.addEventListener('DOMContentLoaded', () => {
             const controller = new ReportController();
-            // Initialize usage table
-            controller.renderUsageTable();
-            // Initialize dependency diagram
-            controller.initDependencyDiagram();
+            controller.ready.then(() => {
+                // Initialize usage table
+                controller.renderUsageTable();
+                // Initialize dependency diagram
+                controller.initDependencyDiagram();
+            });
         });
-    </script>"""""
\ No newline at end of file
+    </script>""".replace('__DIAGRAM_NODE_COLORS__', json.dumps(_DIAGRAM_NODE_COLORS)).replace(
+            '__DIAGRAM_OBJECT_COLUMNS__', json.dumps([
+                {'type': obj_type, 'filter': filter_key, 'x': x}
+                for obj_type, filter_key, x in _DIAGRAM_OBJECT_COLUMNS
+            ]))
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 from .analysis_result import AnalysisResult, AnalysisStatistics
 from .config import AnalysisConfig
-from .dependency import ObjectDependency, TableDependency
+from .dependency import DependencyArrays, ObjectDependency, TableDependency
 from .object import DatabaseObject
 from .table import ObjectReference, Table
 
@@ -11,6 +11,7 @@ __all__ = [
     "AnalysisResult",
     "AnalysisStatistics",
     "DatabaseObject",
+    "DependencyArrays",
     "ObjectDependency",
     "ObjectReference",
     "Table",
@@ -0,0 +1,7 @@
+"""Version compatibility helpers for the data models."""
+
+import sys
+
+# ``slots=True`` is only accepted by dataclass() on Python 3.10+; on older
+# interpreters the models fall back to a regular per-instance ``__dict__``.
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -33,6 +33,7 @@ class AnalysisStatistics:
     active_dependencies: int
     unused_table_ids: List[int]
     most_referenced_table: Optional[Dict[str, Any]] = None
+    _summary: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def usage_percentage(self) -> float:
@@ -49,20 +50,27 @@ class AnalysisStatistics:
         return (self.unused_tables / self.total_tables) * 100
 
     def summary_text(self) -> str:
-        """Return formatted summary text."""
+        """Return formatted summary text.
+
+        The instance is frozen, so the text is built once and reused.
+        """
+        if self._summary is not None:
+            return self._summary
         ref_info = ""
         if self.most_referenced_table:
             ref_info = (
                 f"\n  Most Referenced Table: {self.most_referenced_table['table_name']} "
                 f"({self.most_referenced_table['reference_count']} references)"
             )
-        return (f"Analysis Summary:\n"
-                f"  Total Tables: {self.total_tables}\n"
-                f"  Used Tables: {self.used_tables} ({self.usage_percentage:.1f}%)\n"
-                f"  Unused Tables: {self.unused_tables} ({self.unused_percentage:.1f}%)\n"
-                f"  Total Objects: {self.total_objects}\n"
-                f"  Dependencies: {self.active_dependencies}/{self.total_dependencies} active"
-                f"{ref_info}")
+        summary = (f"Analysis Summary:\n"
+                   f"  Total Tables: {self.total_tables}\n"
+                   f"  Used Tables: {self.used_tables} ({self.usage_percentage:.1f}%)\n"
+                   f"  Unused Tables: {self.unused_tables} ({self.unused_percentage:.1f}%)\n"
+                   f"  Total Objects: {self.total_objects}\n"
+                   f"  Dependencies: {self.active_dependencies}/{self.total_dependencies} active"
+                   f"{ref_info}")
+        object.__setattr__(self, '_summary', summary)
+        return summary
 
 
 @dataclass
@@ -82,18 +90,47 @@ class AnalysisResult:
     statistics: AnalysisStatistics
     processing_time: float
     timestamp: datetime = field(default_factory=datetime.now)
+    _name_index: Optional[Dict[str, Table]] = field(default=None, init=False, repr=False, compare=False)
+    _used: Optional[List[Table]] = field(default=None, init=False, repr=False, compare=False)
+    _unused: Optional[List[Table]] = field(default=None, init=False, repr=False, compare=False)
+
+    def _partition_tables(self) -> None:
+        """Split tables into used and unused lists in a single pass."""
+        used: List[Table] = []
+        unused: List[Table] = []
+        for table in self.tables.values():
+            (used if table.is_used else unused).append(table)
+        self._used = used
+        self._unused = unused
 
     def get_unused_tables(self) -> List[Table]:
-        """Return list of unused tables."""
-        return [table for table in self.tables.values() if not table.is_used]
+        """Return list of unused tables.
+
+        The partition is computed on first access and the same list is
+        returned afterwards, so callers should not mutate it.
+        """
+        if self._unused is None:
+            self._partition_tables()
+        return self._unused
 
     def get_used_tables(self) -> List[Table]:
-        """Return list of used tables."""
-        return [table for table in self.tables.values() if table.is_used]
+        """Return list of used tables.
+
+        Shares the cached partition with ``get_unused_tables``.
+        """
+        if self._used is None:
+            self._partition_tables()
+        return self._used
 
     def get_table_by_name(self, name: str) -> Optional[Table]:
-        """Find table by name (case-insensitive)."""
-        for table in self.tables.values():
-            if table.table_name.lower() == name.lower():
-                return table
-        return None
+        """Find table by name (case-insensitive).
+
+        The lowercase name index is built on first lookup; if several tables
+        share a name ignoring case, the first one in ``tables`` wins.
+        """
+        if self._name_index is None:
+            index: Dict[str, Table] = {}
+            for table in self.tables.values():
+                index.setdefault(table.table_name.lower(), table)
+            self._name_index = index
+        return self._name_index.get(name.lower())
@@ -1,7 +1,7 @@
 """Analysis configuration data model."""
 
 import argparse
-from dataclasses import dataclass
+from dataclasses import InitVar, dataclass
 from pathlib import Path
 from typing import Optional
 
@@ -21,6 +21,9 @@ class AnalysisConfig:
         ignore_inactive_dependencies: Whether to ignore inactive dependencies.
         max_workers: Maximum number of worker threads.
         memory_limit_mb: Memory limit in MB.
+        validate_paths: Whether to check the input and output paths on
+            construction. Pass False when the paths are already known to be
+            valid to skip the filesystem checks.
     """
 
     # Input files
@@ -39,8 +42,13 @@ class AnalysisConfig:
     max_workers: int = 4
     memory_limit_mb: int = 512
 
-    def __post_init__(self):
+    validate_paths: InitVar[bool] = True
+
+    def __post_init__(self, validate_paths: bool):
         """Validate configuration."""
+        if not validate_paths:
+            return
+
         required_files = [
             self.tables_file,
             self.objects_file,
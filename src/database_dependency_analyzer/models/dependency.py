@@ -1,9 +1,14 @@
 """Dependency relationship data models."""
 
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
+from itertools import compress
+from typing import Iterable, Iterator, Tuple, Union
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TableDependency:
     """Represents a dependency from an object to a table.
 
@@ -24,8 +29,20 @@ class TableDependency:
         if not isinstance(self.table_id, int) or self.table_id <= 0:
             raise ValueError(f"Invalid table_id: {self.table_id}")
 
+    @classmethod
+    def _unchecked(cls, object_id: int, table_id: int, active: bool = True) -> 'TableDependency':
+        """Create an instance without running validation.
+
+        Only for callers that have already checked both IDs are positive ints.
+        """
+        dep = object.__new__(cls)
+        object.__setattr__(dep, 'object_id', object_id)
+        object.__setattr__(dep, 'table_id', table_id)
+        object.__setattr__(dep, 'active', active)
+        return dep
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ObjectDependency:
     """Represents a dependency from one object to another.
 
@@ -44,4 +61,60 @@ class ObjectDependency:
         if not isinstance(self.source_object_id, int) or self.source_object_id <= 0:
             raise ValueError(f"Invalid source_object_id: {self.source_object_id}")
         if not isinstance(self.target_object_id, int) or self.target_object_id <= 0:
-            raise ValueError(f"Invalid target_object_id: {self.target_object_id}")
\ No newline at end of file
+            raise ValueError(f"Invalid target_object_id: {self.target_object_id}")
+
+    @classmethod
+    def _unchecked(cls, source_object_id: int, target_object_id: int,
+                   active: bool = True) -> 'ObjectDependency':
+        """Create an instance without running validation.
+
+        Only for callers that have already checked both IDs are positive ints.
+        """
+        dep = object.__new__(cls)
+        object.__setattr__(dep, 'source_object_id', source_object_id)
+        object.__setattr__(dep, 'target_object_id', target_object_id)
+        object.__setattr__(dep, 'active', active)
+        return dep
+
+
+@dataclass
+class DependencyArrays:
+    """Column-oriented storage for dependency relationships.
+
+    Holds the same data as a list of TableDependency or ObjectDependency
+    records in three parallel arrays, which takes a fraction of the memory
+    for large exports and can be filtered without touching model objects.
+
+    Attributes:
+        sources: IDs of the depending objects (ObjectID / SourceObjectID).
+        targets: IDs of the depended-upon tables or objects (TableID / TargetObjectID).
+        active: 1 where the dependency is active, 0 otherwise.
+    """
+
+    sources: array = field(default_factory=lambda: array('q'))
+    targets: array = field(default_factory=lambda: array('q'))
+    active: array = field(default_factory=lambda: array('b'))
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def append(self, source: int, target: int, active: bool = True) -> None:
+        """Append one dependency to the columns."""
+        self.sources.append(source)
+        self.targets.append(target)
+        self.active.append(1 if active else 0)
+
+    def active_edges(self) -> Iterator[Tuple[int, int]]:
+        """Return (source, target) pairs for active dependencies only."""
+        return compress(zip(self.sources, self.targets), self.active)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Union[TableDependency, ObjectDependency]]) -> 'DependencyArrays':
+        """Build column arrays from a sequence of dependency records."""
+        arrays = cls()
+        for dep in records:
+            if isinstance(dep, TableDependency):
+                arrays.append(dep.object_id, dep.table_id, dep.active)
+            else:
+                arrays.append(dep.source_object_id, dep.target_object_id, dep.active)
+        return arrays
\ No newline at end of file
@@ -2,34 +2,66 @@
 
 from dataclasses import dataclass
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass(frozen=True)
+# Shared by DatabaseObject and ObjectReference: maps every accepted spelling
+# (Access exports use the plural) to the singular name the rest of the code uses,
+# so __post_init__ validates and normalises with one dict lookup.
+_CANONICAL_TYPES = {
+    'Form': 'Form', 'Forms': 'Form',
+    'Query': 'Query', 'Queries': 'Query',
+    'Macro': 'Macro', 'Macros': 'Macro',
+    'Report': 'Report', 'Reports': 'Report',
+}
+_VALID_TYPES = frozenset(_CANONICAL_TYPES)
+
+# CSS class for each valid type, so css_class is a lookup rather than string work
+_CSS_CLASS = {t: f"object-{t.lower()}" for t in _VALID_TYPES}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DatabaseObject:
     """Represents a database object (Form, Query, Macro, Report).
 
     Attributes:
         object_id: Unique identifier for the database object.
         object_name: Name of the database object.
-        object_type: Type of the object (Form, Query, Macro, Report).
+        object_type: Type of the object (Form, Query, Macro, Report); plural
+            spellings are normalised to these on construction.
     """
 
     object_id: int
     object_name: str
     object_type: str
 
-    VALID_OBJECT_TYPES = {'Form', 'Forms', 'Query', 'Queries', 'Macro', 'Macros', 'Report', 'Reports'}
+    VALID_OBJECT_TYPES = _VALID_TYPES
 
     def __post_init__(self):
-        """Validate database object data."""
+        """Validate database object data and normalise its type."""
         if not isinstance(self.object_id, int) or self.object_id <= 0:
             raise ValueError(f"Invalid object_id: {self.object_id}")
         if not self.object_name or not self.object_name.strip():
             raise ValueError(f"Invalid object_name: {self.object_name}")
-        if self.object_type not in self.VALID_OBJECT_TYPES:
+        canonical = _CANONICAL_TYPES.get(self.object_type)
+        if canonical is None:
             raise ValueError(f"Invalid object_type: {self.object_type}. "
-                           f"Must be one of {self.VALID_OBJECT_TYPES}")
+                           f"Must be one of {sorted(_VALID_TYPES)}")
+        object.__setattr__(self, 'object_type', canonical)
+
+    @classmethod
+    def _unchecked(cls, object_id: int, object_name: str, object_type: str) -> 'DatabaseObject':
+        """Create an instance without running validation.
+
+        Only for callers whose data has already been validated and
+        normalised by ``__post_init__``.
+        """
+        obj = object.__new__(cls)
+        object.__setattr__(obj, 'object_id', object_id)
+        object.__setattr__(obj, 'object_name', object_name)
+        object.__setattr__(obj, 'object_type', object_type)
+        return obj
 
     @property
     def css_class(self) -> str:
         """Return CSS class for styling."""
-        return f"object-{self.object_type.lower()}"
\ No newline at end of file
+        return _CSS_CLASS[self.object_type]
\ No newline at end of file
@@ -1,17 +1,21 @@
 """Table and ObjectReference data models."""
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List, Optional
 
+from ._compat import DATACLASS_SLOTS
+from .object import _CANONICAL_TYPES, _CSS_CLASS, _VALID_TYPES
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ObjectReference:
     """Represents a reference from a database object to a table.
 
     Attributes:
         object_id: Unique identifier for the database object.
         object_name: Name of the database object.
-        object_type: Type of the object (Form, Query, Macro, Report).
+        object_type: Type of the object (Form, Query, Macro, Report); plural
+            spellings are normalised to these on construction.
         active: Whether this reference is active.
     """
 
@@ -20,17 +24,34 @@ class ObjectReference:
     object_type: str  # Form, Query, Macro, Report
     active: bool = True
 
-    VALID_OBJECT_TYPES = {'Form', 'Forms', 'Query', 'Queries', 'Macro', 'Macros', 'Report', 'Reports'}
+    VALID_OBJECT_TYPES = _VALID_TYPES
 
     def __post_init__(self):
-        """Validate object reference data."""
+        """Validate object reference data and normalise its type."""
         if not isinstance(self.object_id, int) or self.object_id <= 0:
             raise ValueError(f"Invalid object_id: {self.object_id}")
         if not self.object_name or not self.object_name.strip():
             raise ValueError(f"Invalid object_name: {self.object_name}")
-        if self.object_type not in self.VALID_OBJECT_TYPES:
+        canonical = _CANONICAL_TYPES.get(self.object_type)
+        if canonical is None:
             raise ValueError(f"Invalid object_type: {self.object_type}. "
-                           f"Must be one of {self.VALID_OBJECT_TYPES}")
+                           f"Must be one of {sorted(_VALID_TYPES)}")
+        object.__setattr__(self, 'object_type', canonical)
+
+    @classmethod
+    def _unchecked(cls, object_id: int, object_name: str, object_type: str,
+                   active: bool = True) -> 'ObjectReference':
+        """Create an instance without running validation.
+
+        Only for callers whose data has already been validated and
+        normalised, e.g. references built from a DatabaseObject.
+        """
+        ref = object.__new__(cls)
+        object.__setattr__(ref, 'object_id', object_id)
+        object.__setattr__(ref, 'object_name', object_name)
+        object.__setattr__(ref, 'object_type', object_type)
+        object.__setattr__(ref, 'active', active)
+        return ref
 
     @property
     def display_name(self) -> str:
@@ -40,10 +61,10 @@ class ObjectReference:
     @property
     def css_class(self) -> str:
         """Return CSS class for styling based on object type."""
-        return f"object-{self.object_type.lower()}"
+        return _CSS_CLASS[self.object_type]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Table:
     """Represents a database table and its usage information.
 
@@ -58,6 +79,9 @@ class Table:
     table_name: str
     is_used: bool = False
     referencing_objects: List[ObjectReference] = field(default_factory=list)
+    # Side index of object ID -> position in referencing_objects for O(1)
+    # dedup in add_reference
+    _ref_index: Optional[Dict[int, int]] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate table data after initialization."""
@@ -66,15 +90,49 @@ class Table:
         if not self.table_name or not self.table_name.strip():
             raise ValueError(f"Invalid table_name: {self.table_name}")
 
+    @classmethod
+    def _unchecked(cls, table_id: int, table_name: str, is_used: bool = False,
+                   referencing_objects: Optional[List[ObjectReference]] = None) -> 'Table':
+        """Create an instance without running validation.
+
+        Only for callers that have already checked the ID is a positive int
+        and the name is non-blank.
+        """
+        table = object.__new__(cls)
+        object.__setattr__(table, 'table_id', table_id)
+        object.__setattr__(table, 'table_name', table_name)
+        object.__setattr__(table, 'is_used', is_used)
+        object.__setattr__(table, 'referencing_objects',
+                           referencing_objects if referencing_objects is not None else [])
+        object.__setattr__(table, '_ref_index', None)
+        return table
+
     @property
     def status(self) -> str:
         """Return human-readable status."""
         return "Used" if self.is_used else "Unused"
 
     def add_reference(self, obj_ref: ObjectReference) -> None:
-        """Add an object reference to this table."""
-        if obj_ref not in self.referencing_objects:
+        """Add an object reference to this table.
+
+        An object is listed once; a repeat reference only matters when it
+        is active, in which case the listed reference becomes active too.
+        """
+        ref_index = self._ref_index
+        if ref_index is None:
+            ref_index = {}
+            for i, ref in enumerate(self.referencing_objects):
+                ref_index.setdefault(ref.object_id, i)
+            object.__setattr__(self, '_ref_index', ref_index)
+        i = ref_index.get(obj_ref.object_id)
+        if i is None:
+            ref_index[obj_ref.object_id] = len(self.referencing_objects)
             self.referencing_objects.append(obj_ref)
-            # Update usage status if we have active references
-            if obj_ref.active:
-                object.__setattr__(self, 'is_used', True)
\ No newline at end of file
+        elif obj_ref.active and not self.referencing_objects[i].active:
+            existing = self.referencing_objects[i]
+            self.referencing_objects[i] = ObjectReference._unchecked(
+                existing.object_id, existing.object_name, existing.object_type, True
+            )
+        # Update usage status if we have active references
+        if obj_ref.active:
+            object.__setattr__(self, 'is_used', True)
\ No newline at end of file
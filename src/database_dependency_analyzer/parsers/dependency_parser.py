@@ -1,12 +1,13 @@
 """Parser for dependency XML files."""
 
 import logging
+from itertools import starmap
 from pathlib import Path
-from typing import List, Any
+from typing import List, Any, Tuple
 
 from .xml_parser import BaseXMLParser
 from ..models.config import AnalysisConfig
-from ..models.dependency import TableDependency, ObjectDependency
+from ..models.dependency import DependencyArrays, TableDependency, ObjectDependency
 
 
 class DependencyParser(BaseXMLParser):
@@ -15,6 +16,15 @@ class DependencyParser(BaseXMLParser):
     Handles both Analysis_TableDependencies.xml and Analysis_ObjectDependencies.xml.
     """
 
+    __slots__ = ()
+
+    # Record fields read by process(), in the order the *_dependency_rows
+    # helpers unpack them
+    _TABLE_DEPENDENCY_FIELDS = ('ObjectID', 'TableID', 'Active')
+    _OBJECT_DEPENDENCY_FIELDS = (
+        'SourceObjectID', 'ParentObjectID', 'TargetObjectID', 'ChildObjectID', 'Active'
+    )
+
     def __init__(self, config: AnalysisConfig):
         """Initialize the dependency parser.
 
@@ -47,47 +57,81 @@ class DependencyParser(BaseXMLParser):
         Returns:
             List of TableDependency objects.
         """
-        tree = self.parse_file(file_path)
-        root = tree.getroot()
+        dependencies: List[TableDependency] = []
+        # Rows are validated in batches, so skip the dataclass checks
+        make = TableDependency._unchecked
 
-        dependencies = []
-        dep_elements = self.find_elements(root, 'Analysis_TableDependencies')
+        def on_batch(columns: List[Tuple[str, ...]]) -> None:
+            dependencies.extend(starmap(make, self._table_dependency_rows(columns)))
 
-        for elem in dep_elements:
-            try:
-                dep = self._parse_table_dependency_element(elem)
-                dependencies.append(dep)
-            except (ValueError, KeyError) as e:
-                self.logger.error(f"Failed to parse table dependency: {e}")
-                continue
+        self.process_batches(file_path, 'Analysis_TableDependencies',
+                             self._TABLE_DEPENDENCY_FIELDS, on_batch)
 
         self.logger.info(f"Parsed {len(dependencies)} table dependencies")
         return dependencies
 
-    def _parse_table_dependency_element(self, elem) -> TableDependency:
-        """Parse individual table dependency element.
+    def parse_table_dependency_arrays(self, file_path: Path) -> DependencyArrays:
+        """Parse table dependency relationships into column arrays.
+
+        Equivalent to ``parse_table_dependencies`` but stores ObjectID,
+        TableID and Active in parallel arrays instead of building a
+        TableDependency per row.
 
         Args:
-            elem: XML element representing a table dependency.
+            file_path: Path to the Analysis_TableDependencies.xml file.
 
         Returns:
-            TableDependency object.
+            DependencyArrays with ObjectIDs as sources and TableIDs as targets.
+        """
+        arrays = DependencyArrays()
+
+        def on_batch(columns: List[Tuple[str, ...]]) -> None:
+            self._extend_arrays(arrays, self._table_dependency_rows(columns), 'table')
+
+        self.process_batches(file_path, 'Analysis_TableDependencies',
+                             self._TABLE_DEPENDENCY_FIELDS, on_batch)
+
+        self.logger.info(f"Parsed {len(arrays)} table dependencies")
+        return arrays
+
+    def _table_dependency_rows(self, columns: List[Tuple[str, ...]]) -> List[Tuple[int, int, bool]]:
+        """Convert and validate a batch of table dependency records.
 
-        Raises:
-            ValueError: If required fields are missing or invalid.
+        Args:
+            columns: Field text columns ordered as in ``_TABLE_DEPENDENCY_FIELDS``.
+
+        Returns:
+            List of (object_id, table_id, active) tuples for the valid records.
+            Invalid records are logged and dropped.
         """
-        object_id = self.get_int(elem, 'ObjectID')
-        table_id = self.get_int(elem, 'TableID')
-        active = self.get_bool(elem, 'Active', True)
+        object_texts, table_texts, active_texts = columns
+        object_ids = self.to_int_batch(object_texts, 'ObjectID')
+        table_ids = self.to_int_batch(table_texts, 'TableID')
+        rows = list(zip(object_ids, table_ids, self.to_bool_batch(active_texts, 'Active', True)))
 
-        if not object_id or not table_id:
-            raise ValueError("Missing required dependency fields")
+        if min(object_ids) > 0 and min(table_ids) > 0:
+            return rows
+        return [row for row in rows if self._is_valid_table_dependency(*row)]
+
+    def _is_valid_table_dependency(self, object_id: int, table_id: int, active: bool) -> bool:
+        """Check the IDs of a converted table dependency, logging why it is invalid.
 
-        return TableDependency(
-            object_id=object_id,
-            table_id=table_id,
-            active=active
-        )
+        Args:
+            object_id: Converted ObjectID, 0 if missing.
+            table_id: Converted TableID, 0 if missing.
+            active: Converted Active flag.
+
+        Returns:
+            True if both IDs are positive.
+        """
+        if not object_id or not table_id:
+            self.logger.error("Failed to parse table dependency: Missing required dependency fields")
+            return False
+        if object_id < 0 or table_id < 0:
+            self.logger.error("Failed to parse table dependency: Invalid dependency IDs: "
+                              "ObjectID=%s, TableID=%s", object_id, table_id)
+            return False
+        return True
 
     def parse_object_dependencies(self, file_path: Path) -> List[ObjectDependency]:
         """Parse object dependency relationships.
@@ -98,47 +142,106 @@ class DependencyParser(BaseXMLParser):
         Returns:
             List of ObjectDependency objects.
         """
-        tree = self.parse_file(file_path)
-        root = tree.getroot()
+        dependencies: List[ObjectDependency] = []
+        # Rows are validated in batches, so skip the dataclass checks
+        make = ObjectDependency._unchecked
 
-        dependencies = []
-        dep_elements = self.find_elements(root, 'Analysis_ObjectDependencies')
+        def on_batch(columns: List[Tuple[str, ...]]) -> None:
+            dependencies.extend(starmap(make, self._object_dependency_rows(columns)))
 
-        for elem in dep_elements:
-            try:
-                dep = self._parse_object_dependency_element(elem)
-                if dep is not None:
-                    dependencies.append(dep)
-            except (ValueError, KeyError) as e:
-                self.logger.error(f"Failed to parse object dependency: {e}")
-                continue
+        self.process_batches(file_path, 'Analysis_ObjectDependencies',
+                             self._OBJECT_DEPENDENCY_FIELDS, on_batch)
 
         self.logger.info(f"Parsed {len(dependencies)} object dependencies")
         return dependencies
 
-    def _parse_object_dependency_element(self, elem) -> ObjectDependency:
-        """Parse individual object dependency element.
+    def parse_object_dependency_arrays(self, file_path: Path) -> DependencyArrays:
+        """Parse object dependency relationships into column arrays.
+
+        Equivalent to ``parse_object_dependencies`` but stores the IDs and
+        Active flag in parallel arrays instead of building an
+        ObjectDependency per row.
 
         Args:
-            elem: XML element representing an object dependency.
+            file_path: Path to the Analysis_ObjectDependencies.xml file.
 
         Returns:
-            ObjectDependency object.
+            DependencyArrays with source object IDs as sources and target
+            object IDs as targets.
+        """
+        arrays = DependencyArrays()
+
+        def on_batch(columns: List[Tuple[str, ...]]) -> None:
+            self._extend_arrays(arrays, self._object_dependency_rows(columns), 'object')
+
+        self.process_batches(file_path, 'Analysis_ObjectDependencies',
+                             self._OBJECT_DEPENDENCY_FIELDS, on_batch)
+
+        self.logger.info(f"Parsed {len(arrays)} object dependencies")
+        return arrays
+
+    def _object_dependency_rows(self, columns: List[Tuple[str, ...]]) -> List[Tuple[int, int, bool]]:
+        """Convert and validate a batch of object dependency records.
+
+        Args:
+            columns: Field text columns ordered as in ``_OBJECT_DEPENDENCY_FIELDS``.
 
-        Raises:
-            ValueError: If required fields are missing or invalid.
+        Returns:
+            List of (source_id, target_id, active) tuples for the valid records.
+            Records with missing or invalid IDs are logged and dropped.
         """
-        # Try different field names that might be used in the XML
-        source_id = self.get_int(elem, 'SourceObjectID') or self.get_int(elem, 'ParentObjectID')
-        target_id = self.get_int(elem, 'TargetObjectID') or self.get_int(elem, 'ChildObjectID')
-        active = self.get_bool(elem, 'Active', True)
+        source_texts, parent_texts, target_texts, child_texts, active_texts = columns
+        to_int = self.to_int
+        # Fall back to the Parent/Child spellings only where the primary field is empty
+        source_ids = [
+            source_id or to_int(parent_text, 'ParentObjectID')
+            for source_id, parent_text in zip(self.to_int_batch(source_texts, 'SourceObjectID'),
+                                              parent_texts)
+        ]
+        target_ids = [
+            target_id or to_int(child_text, 'ChildObjectID')
+            for target_id, child_text in zip(self.to_int_batch(target_texts, 'TargetObjectID'),
+                                             child_texts)
+        ]
+        rows = list(zip(source_ids, target_ids, self.to_bool_batch(active_texts, 'Active', True)))
+
+        if min(source_ids) > 0 and min(target_ids) > 0:
+            return rows
+        return [row for row in rows if self._is_valid_object_dependency(*row)]
+
+    def _is_valid_object_dependency(self, source_id: int, target_id: int, active: bool) -> bool:
+        """Check the IDs of a converted object dependency, logging why it is invalid.
+
+        Args:
+            source_id: Converted source object ID, 0 if missing.
+            target_id: Converted target object ID, 0 if missing.
+            active: Converted Active flag.
 
+        Returns:
+            True if both IDs are positive.
+        """
         if not source_id or not target_id:
-            self.logger.warning(f"Skipping dependency with missing fields: SourceObjectID={source_id}, TargetObjectID={target_id}")
-            return None
-
-        return ObjectDependency(
-            source_object_id=source_id,
-            target_object_id=target_id,
-            active=active
-        )
\ No newline at end of file
+            self.logger.warning("Skipping dependency with missing fields: SourceObjectID=%s, TargetObjectID=%s",
+                                source_id, target_id)
+            return False
+        if source_id < 0 or target_id < 0:
+            self.logger.error("Failed to parse object dependency: Invalid dependency IDs: "
+                              "SourceObjectID=%s, TargetObjectID=%s", source_id, target_id)
+            return False
+        return True
+
+    def _extend_arrays(self, arrays: DependencyArrays,
+                       rows: List[Tuple[int, int, bool]], kind: str) -> None:
+        """Append validated rows to column arrays, dropping IDs that overflow them.
+
+        Args:
+            arrays: Arrays to append to.
+            rows: Validated (source, target, active) rows.
+            kind: ``'table'`` or ``'object'``, used in error messages.
+        """
+        append = arrays.append
+        for row in rows:
+            try:
+                append(*row)
+            except OverflowError as e:
+                self.logger.error("Failed to parse %s dependency: %s", kind, e)
@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 from .xml_parser import BaseXMLParser
 from ..models.config import AnalysisConfig
@@ -15,6 +15,11 @@ class ObjectParser(BaseXMLParser):
     Parses object definitions from Microsoft Access XML exports.
     """
 
+    __slots__ = ()
+
+    # Record fields read by process(), in the order _parse_object_record unpacks them
+    _FIELDS = ('ObjectID', 'ObjectName', 'ObjectType')
+
     def __init__(self, config: AnalysisConfig):
         """Initialize the object parser.
 
@@ -32,31 +37,43 @@ class ObjectParser(BaseXMLParser):
         Returns:
             Dictionary mapping object IDs to DatabaseObject instances.
         """
-        tree = self.parse_file(file_path)
-        root = tree.getroot()
+        parsed: List[DatabaseObject] = []
+        append = parsed.append
+
+        def on_record(values: Tuple[str, ...]) -> None:
+            obj = self._parse_object_record_safe(values)
+            if obj is not None:
+                append(obj)
 
-        objects = {}
-        object_elements = self.find_elements(root, 'Analysis_Objects')
+        self.process(file_path, 'Analysis_Objects', self._FIELDS, on_record)
 
-        for elem in object_elements:
-            try:
-                obj = self._parse_object_element(elem)
+        objects = {obj.object_id: obj for obj in parsed}
+
+        if len(objects) != len(parsed):
+            # Duplicates present: rebuild keeping the first occurrence of each ID
+            objects = {}
+            for obj in parsed:
                 if obj.object_id not in objects:
                     objects[obj.object_id] = obj
                 else:
-                    self.logger.warning(f"Duplicate object ID: {obj.object_id}")
-            except (ValueError, KeyError) as e:
-                self.logger.error(f"Failed to parse object element: {e}")
-                continue
+                    self.logger.warning("Duplicate object ID: %s", obj.object_id)
 
         self.logger.info(f"Parsed {len(objects)} objects")
         return objects
 
-    def _parse_object_element(self, elem) -> DatabaseObject:
-        """Parse individual object element.
+    def _parse_object_record_safe(self, values: Tuple[str, ...]) -> Optional[DatabaseObject]:
+        """Parse an object record, logging and returning None if it is invalid."""
+        try:
+            return self._parse_object_record(values)
+        except (ValueError, KeyError) as e:
+            self.logger.error("Failed to parse object record: %s", e)
+            return None
+
+    def _parse_object_record(self, values: Tuple[str, ...]) -> DatabaseObject:
+        """Build a object from its record fields.
 
         Args:
-            elem: XML element representing a database object.
+            values: Field texts of the record, ordered as in ``_FIELDS``.
 
         Returns:
             DatabaseObject instance.
@@ -64,9 +81,8 @@ class ObjectParser(BaseXMLParser):
         Raises:
             ValueError: If required fields are missing or invalid.
         """
-        object_id = self.get_int(elem, 'ObjectID')
-        object_name = self.get_text(elem, 'ObjectName')
-        object_type = self.get_text(elem, 'ObjectType')
+        id_text, object_name, object_type = values
+        object_id = self.to_int(id_text, 'ObjectID')
 
         if not object_id or not object_name or not object_type:
             raise ValueError("Missing required object fields")
@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 from .xml_parser import BaseXMLParser
 from ..models.config import AnalysisConfig
@@ -15,6 +15,11 @@ class TableParser(BaseXMLParser):
     Parses table definitions from Microsoft Access XML exports.
     """
 
+    __slots__ = ()
+
+    # Record fields read by process(), in the order _parse_table_record unpacks them
+    _FIELDS = ('TableID', 'TableName')
+
     def __init__(self, config: AnalysisConfig):
         """Initialize the table parser.
 
@@ -32,31 +37,43 @@ class TableParser(BaseXMLParser):
         Returns:
             Dictionary mapping table IDs to Table objects.
         """
-        tree = self.parse_file(file_path)
-        root = tree.getroot()
+        parsed: List[Table] = []
+        append = parsed.append
+
+        def on_record(values: Tuple[str, ...]) -> None:
+            table = self._parse_table_record_safe(values)
+            if table is not None:
+                append(table)
 
-        tables = {}
-        table_elements = self.find_elements(root, 'Analysis_Tables')
+        self.process(file_path, 'Analysis_Tables', self._FIELDS, on_record)
 
-        for elem in table_elements:
-            try:
-                table = self._parse_table_element(elem)
+        tables = {table.table_id: table for table in parsed}
+
+        if len(tables) != len(parsed):
+            # Duplicates present: rebuild keeping the first occurrence of each ID
+            tables = {}
+            for table in parsed:
                 if table.table_id not in tables:
                     tables[table.table_id] = table
                 else:
-                    self.logger.warning(f"Duplicate table ID: {table.table_id}")
-            except (ValueError, KeyError) as e:
-                self.logger.error(f"Failed to parse table element: {e}")
-                continue
+                    self.logger.warning("Duplicate table ID: %s", table.table_id)
 
         self.logger.info(f"Parsed {len(tables)} tables")
         return tables
 
-    def _parse_table_element(self, elem) -> Table:
-        """Parse individual table element.
+    def _parse_table_record_safe(self, values: Tuple[str, ...]) -> Optional[Table]:
+        """Parse a table record, logging and returning None if it is invalid."""
+        try:
+            return self._parse_table_record(values)
+        except (ValueError, KeyError) as e:
+            self.logger.error("Failed to parse table record: %s", e)
+            return None
+
+    def _parse_table_record(self, values: Tuple[str, ...]) -> Table:
+        """Build a table from its record fields.
 
         Args:
-            elem: XML element representing a table.
+            values: Field texts of the record, ordered as in ``_FIELDS``.
 
         Returns:
             Table object.
@@ -64,13 +81,13 @@ class TableParser(BaseXMLParser):
         Raises:
             ValueError: If required fields are missing or invalid.
         """
-        table_id = self.get_int(elem, 'TableID')
-        table_name = self.get_text(elem, 'TableName')
+        id_text, table_name = values
+        table_id = self.to_int(id_text, 'TableID')
 
         if not table_id or not table_name:
             raise ValueError("Missing required table fields")
+        if table_id < 0:
+            raise ValueError(f"Invalid table_id: {table_id}")
 
-        return Table(
-            table_id=table_id,
-            table_name=table_name
-        )
\ No newline at end of file
+        # Fields are validated above, so skip the dataclass checks
+        return Table._unchecked(table_id, table_name)
\ No newline at end of file
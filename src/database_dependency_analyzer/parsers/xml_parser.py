@@ -1,19 +1,138 @@
 """Base XML parser with namespace handling for Microsoft Access XML exports."""
 
 import logging
-import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from lxml import etree
 
 from ..models.config import AnalysisConfig
 
+# Namespace mappings found in Microsoft Access XML exports
+_NAMESPACE_MAP = {
+    'od': 'urn:schemas-microsoft-com:officedata',
+    'xsi': 'http://www.w3.org/2001/XMLSchema-instance',
+    'xsd': 'http://www.w3.org/2001/XMLSchema'
+}
+
+# Register once so serialised trees use these prefixes instead of ns0:
+for _prefix, _uri in _NAMESPACE_MAP.items():
+    etree.register_namespace(_prefix, _uri)
+
+# Clark-notation prefix for the Access namespace, e.g. "{urn:...}"
+_OD_PREFIX = f"{{{_NAMESPACE_MAP['od']}}}"
+
+# Boolean spellings accepted by to_bool and to_bool_batch, case-insensitively.
+# The common lower, capitalised and upper cases are listed as-is so they are
+# looked up without lower-casing the text first.
+_BOOL_TEXTS = {
+    spelling: value
+    for text, value in {'true': True, '1': True, 'yes': True,
+                        'false': False, '0': False, 'no': False}.items()
+    for spelling in (text, text.capitalize(), text.upper())
+}
+
 
 class XMLParseError(Exception):
     """Raised when XML parsing fails."""
     pass
 
 
+class _RecordTarget:
+    """lxml parser target that collects child field texts of record elements.
+
+    Records are direct children of the root with a wanted tag; their fields are
+    direct children matched by plain or ``od``-namespaced tag. No element tree
+    is built: each finished record's field texts are passed to ``on_record``.
+    """
+
+    # Every parse event reads and writes these, so keep them out of a __dict__
+    __slots__ = ('record_tags', 'slots', 'count', 'on_record', 'on_root',
+                 'depth', 'values', 'slot', 'text')
+
+    def __init__(self, record_tags: Set[str], slots: Dict[str, int], count: int,
+                 on_record: Callable[[Tuple[str, ...]], Any],
+                 on_root: Callable[[str], None]):
+        self.record_tags = record_tags
+        self.slots = slots
+        self.count = count
+        self.on_record = on_record
+        self.on_root = on_root
+        self.depth = 0
+        self.values: Optional[List[Optional[str]]] = None
+        # Slot of the field whose text is being collected, and that text
+        self.slot: Optional[int] = None
+        self.text = ""
+
+    def start(self, tag: str, attrib: Any) -> None:
+        depth = self.depth = self.depth + 1
+        if depth == 3:
+            values = self.values
+            if values is not None:
+                slot = self.slots.get(tag)
+                # First occurrence of a field wins
+                if slot is not None and values[slot] is None:
+                    self.slot = slot
+                    self.text = ""
+        elif depth == 2:
+            self.values = [None] * self.count if tag in self.record_tags else None
+        elif depth == 1:
+            self.on_root(tag)
+        elif self.slot is not None:
+            # Like Element.text, a field's text stops at its first child
+            self.values[self.slot] = self.text.strip()
+            self.slot = None
+
+    def data(self, text: str) -> None:
+        if self.slot is not None:
+            self.text += text
+
+    def end(self, tag: str) -> None:
+        depth = self.depth
+        self.depth = depth - 1
+        if depth == 3:
+            slot = self.slot
+            if slot is not None:
+                self.values[slot] = self.text.strip()
+                self.slot = None
+        elif depth == 2:
+            values = self.values
+            if values is not None:
+                self.values = None
+                self.on_record(tuple([value or "" for value in values]))
+
+    def close(self) -> None:
+        return None
+
+
+def _read_records(path: str, tag: str, fields: Sequence[str],
+                  on_record: Callable[[Tuple[str, ...]], Any],
+                  on_root: Callable[[str], None]) -> None:
+    """Stream the records of one file to ``on_record`` as they are parsed.
+
+    Args:
+        path: Path to the XML file to parse.
+        tag: Record element tag.
+        fields: Child tag names to extract from each record.
+        on_record: Called with the tuple of field texts for every record.
+        on_root: Called with the root tag before any record.
+
+    Raises:
+        etree.ParseError: If parsing fails.
+    """
+    slots: Dict[str, int] = {}
+    for i, field_tag in enumerate(fields):
+        slots[field_tag] = i
+        slots[_OD_PREFIX + field_tag] = i
+    target = _RecordTarget({tag, _OD_PREFIX + tag}, slots, len(fields),
+                           on_record, on_root)
+
+    parser = etree.XMLParser(target=target, huge_tree=True, resolve_entities=False,
+                             remove_blank_text=True)
+    etree.parse(path, parser=parser)
+
+
 class BaseXMLParser(ABC):
     """Base class for XML parsing with namespace handling.
 
@@ -21,6 +140,13 @@ class BaseXMLParser(ABC):
     including namespace-aware parsing with fallback to non-namespaced XML.
     """
 
+    __slots__ = ('config', 'logger', '_path_cache', '_use_ns')
+
+    # Common namespace mappings found in Access XML exports
+    namespace_map = _NAMESPACE_MAP
+    # Clark-notation prefix for the Access namespace, e.g. "{urn:...}"
+    _od_prefix = _OD_PREFIX
+
     def __init__(self, config: AnalysisConfig):
         """Initialize the XML parser.
 
@@ -30,14 +156,32 @@ class BaseXMLParser(ABC):
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
 
-        # Common namespace mappings found in Access XML exports
-        self.namespace_map = {
-            'od': 'urn:schemas-microsoft-com:officedata',
-            'xsi': 'http://www.w3.org/2001/XMLSchema-instance',
-            'xsd': 'http://www.w3.org/2001/XMLSchema'
-        }
+        # Compiled (namespaced, plain) XPath pairs for find_elements, by path
+        self._path_cache: Dict[str, Tuple[etree.XPath, etree.XPath]] = {}
+        # Whether the current document spells elements with the od: prefix,
+        # learned from the first lookup that matches; None until then
+        self._use_ns: Optional[bool] = None
+
+    def _xml_parser(self) -> etree.XMLParser:
+        """Create the libxml2 parser used for a single parse.
 
-    def parse_file(self, file_path: Path) -> ET.ElementTree:
+        Parsers are not shared because lxml parser objects must not be used
+        from several threads at once. Entity resolution is disabled and
+        comments/processing instructions are dropped so record children
+        are always elements.
+
+        Returns:
+            Configured lxml XMLParser.
+        """
+        return etree.XMLParser(
+            huge_tree=True,
+            collect_ids=False,
+            resolve_entities=False,
+            remove_comments=True,
+            remove_pis=True
+        )
+
+    def parse_file(self, file_path: Path) -> etree._ElementTree:
         """Parse XML file with error handling.
 
         Args:
@@ -51,29 +195,107 @@ class BaseXMLParser(ABC):
             FileNotFoundError: If the file doesn't exist.
         """
         try:
-            # Register namespaces to avoid ns0: prefixes
-            for prefix, uri in self.namespace_map.items():
-                ET.register_namespace(prefix, uri)
+            # libxml2 reports a missing file as a generic OSError
+            if not Path(file_path).exists():
+                raise FileNotFoundError(file_path)
 
-            tree = ET.parse(file_path)
+            tree = etree.parse(str(file_path), parser=self._xml_parser())
             self._validate_root(tree.getroot())
             return tree
 
-        except ET.ParseError as e:
+        except etree.ParseError as e:
+            raise XMLParseError(f"Failed to parse {file_path}: {e}")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"XML file not found: {file_path}")
+
+    def process(self, file_path: Path, tag: str, fields: Sequence[str],
+                on_record: Callable[[Tuple[str, ...]], Any]) -> None:
+        """Feed the record fields of an XML file to a callback.
+
+        libxml2 drives a parser target directly, so no elements are created.
+        Records are direct children of the root whose tag is ``tag``; for
+        each one ``on_record`` receives the stripped text of the requested
+        child fields, in order. Like ``get_text``, only the ``od`` namespace
+        and plain tags are recognised; the first occurrence of a field wins
+        and missing fields read as an empty string.
+
+        Records are handed over as they are parsed and none are retained.
+
+        Args:
+            file_path: Path to the XML file to parse.
+            tag: Record element tag.
+            fields: Child tag names to extract from each record.
+            on_record: Called with the tuple of field texts for every record.
+
+        Raises:
+            XMLParseError: If parsing fails.
+            FileNotFoundError: If the file doesn't exist.
+        """
+        try:
+            # libxml2 reports a missing file as a generic OSError
+            if not Path(file_path).exists():
+                raise FileNotFoundError(file_path)
+
+            _read_records(str(file_path), tag, fields, on_record, self._validate_root_tag)
+
+        except etree.ParseError as e:
             raise XMLParseError(f"Failed to parse {file_path}: {e}")
         except FileNotFoundError:
             raise FileNotFoundError(f"XML file not found: {file_path}")
 
-    def _validate_root(self, root: ET.Element) -> None:
+    def process_batches(self, file_path: Path, tag: str, fields: Sequence[str],
+                        on_batch: Callable[[List[Tuple[str, ...]]], Any],
+                        batch_size: int = 4096) -> None:
+        """Stream record fields from an XML file in column batches.
+
+        Like ``process``, but records are grouped into batches of up to
+        ``batch_size`` and handed to ``on_batch`` column-wise, one tuple of
+        texts per field. This lets callers convert whole columns at once;
+        records are not retained beyond the current batch.
+
+        Args:
+            file_path: Path to the XML file to parse.
+            tag: Record element tag.
+            fields: Child tag names to extract from each record.
+            on_batch: Called with one tuple of field texts per entry in ``fields``.
+            batch_size: Maximum number of records per batch.
+
+        Raises:
+            XMLParseError: If parsing fails.
+            FileNotFoundError: If the file doesn't exist.
+        """
+        batch: List[Tuple[str, ...]] = []
+
+        def on_record(values: Tuple[str, ...]) -> None:
+            batch.append(values)
+            if len(batch) >= batch_size:
+                on_batch(list(zip(*batch)))
+                batch.clear()
+
+        self.process(file_path, tag, fields, on_record)
+        if batch:
+            on_batch(list(zip(*batch)))
+
+    def _validate_root(self, root: etree._Element) -> None:
         """Validate root element structure.
 
         Args:
             root: Root element of the XML document.
         """
-        if root.tag != 'dataroot':
-            self.logger.warning(f"Unexpected root tag: {root.tag}")
+        self._validate_root_tag(root.tag)
+
+    def _validate_root_tag(self, tag: str) -> None:
+        """Warn if the document root is not the expected Access ``dataroot``.
+
+        Args:
+            tag: Tag of the root element.
+        """
+        # A new document: forget the previous one's namespace spelling
+        self._use_ns = None
+        if tag != 'dataroot':
+            self.logger.warning(f"Unexpected root tag: {tag}")
 
-    def find_elements(self, root: ET.Element, path: str) -> List[ET.Element]:
+    def find_elements(self, root: etree._Element, path: str) -> List[etree._Element]:
         """Find elements with namespace-aware path resolution.
 
         Args:
@@ -83,23 +305,37 @@ class BaseXMLParser(ABC):
         Returns:
             List of matching elements.
         """
-        # Try namespaced path first
-        namespaced_path = path
-        if not path.startswith('{'):
-            # Add namespace prefix if not present
-            namespaced_path = f"{{{self.namespace_map['od']}}}{path}"
-
-        elements = root.findall(namespaced_path)
-
-        # Fallback to non-namespaced if no elements found
-        if not elements:
-            elements = root.findall(path)
+        if path.startswith('{'):
+            # Already namespaced; XPath has no Clark notation
+            return root.findall(path)
+
+        compiled = self._path_cache.get(path)
+        if compiled is None:
+            compiled = (
+                etree.XPath(f"od:{path}", namespaces={'od': self.namespace_map['od']}),
+                etree.XPath(path)
+            )
+            self._path_cache[path] = compiled
+        namespaced_xpath, plain_xpath = compiled
+
+        # Try the spelling this document has used so far (namespaced until
+        # known), so plain documents pay for a single query per call
+        prefer_plain = self._use_ns is False
+        elements = (plain_xpath if prefer_plain else namespaced_xpath)(root)
+
+        if elements:
+            self._use_ns = not prefer_plain
+        else:
+            # Fall back to the other spelling
+            elements = (namespaced_xpath if prefer_plain else plain_xpath)(root)
             if elements:
-                self.logger.info(f"Found elements using non-namespaced path: {path}")
+                self._use_ns = prefer_plain
+                if not prefer_plain:
+                    self.logger.info(f"Found elements using non-namespaced path: {path}")
 
         return elements
 
-    def get_text(self, element: ET.Element, tag: str, default: str = "") -> str:
+    def get_text(self, element: etree._Element, tag: str, default: str = "") -> str:
         """Get text content from element with namespace handling.
 
         Args:
@@ -110,17 +346,26 @@ class BaseXMLParser(ABC):
         Returns:
             Text content or default value.
         """
-        # Try namespaced tag first
-        namespaced_tag = f"{{{self.namespace_map['od']}}}{tag}"
-        child = element.find(namespaced_tag)
+        namespaced_tag = self._od_prefix + tag
+        # Try the document's known spelling first, namespaced until known
+        if self._use_ns is False:
+            first, second = tag, namespaced_tag
+        else:
+            first, second = namespaced_tag, tag
+
+        child = element.find(first)
 
         if child is None:
-            # Try non-namespaced
-            child = element.find(tag)
+            # Try the other spelling
+            child = element.find(second)
+            if child is not None:
+                self._use_ns = second is namespaced_tag
+        else:
+            self._use_ns = first is namespaced_tag
 
         return child.text.strip() if child is not None and child.text else default
 
-    def get_int(self, element: ET.Element, tag: str, default: int = 0) -> int:
+    def get_int(self, element: etree._Element, tag: str, default: int = 0) -> int:
         """Get integer value from element.
 
         Args:
@@ -131,14 +376,26 @@ class BaseXMLParser(ABC):
         Returns:
             Integer value or default.
         """
-        text = self.get_text(element, tag)
+        return self.to_int(self.get_text(element, tag), tag, default)
+
+    def to_int(self, text: str, tag: str, default: int = 0) -> int:
+        """Convert element text to an integer.
+
+        Args:
+            text: Text content to convert.
+            tag: Tag name the text came from, used in warnings.
+            default: Default value if text is empty or conversion fails.
+
+        Returns:
+            Integer value or default.
+        """
         try:
             return int(text) if text else default
         except ValueError:
-            self.logger.warning(f"Invalid integer value for {tag}: {text}")
+            self.logger.warning("Invalid integer value for %s: %s", tag, text)
             return default
 
-    def get_bool(self, element: ET.Element, tag: str, default: bool = True) -> bool:
+    def get_bool(self, element: etree._Element, tag: str, default: bool = True) -> bool:
         """Get boolean value from element.
 
         Args:
@@ -149,14 +406,67 @@ class BaseXMLParser(ABC):
         Returns:
             Boolean value or default.
         """
-        text = self.get_text(element, tag).lower()
-        if text in ('true', '1', 'yes'):
-            return True
-        elif text in ('false', '0', 'no'):
-            return False
-        else:
-            self.logger.warning(f"Invalid boolean value for {tag}: {text}")
-            return default
+        return self.to_bool(self.get_text(element, tag), tag, default)
+
+    def to_bool(self, text: str, tag: str, default: bool = True) -> bool:
+        """Convert element text to a boolean.
+
+        Args:
+            text: Text content to convert.
+            tag: Tag name the text came from, used in warnings.
+            default: Default value if conversion fails.
+
+        Returns:
+            Boolean value or default.
+        """
+        value = _BOOL_TEXTS.get(text)
+        if value is None:
+            text = text.lower()
+            value = _BOOL_TEXTS.get(text)
+            if value is None:
+                self.logger.warning("Invalid boolean value for %s: %s", tag, text)
+                return default
+        return value
+
+    def to_int_batch(self, texts: Sequence[str], tag: str, default: int = 0) -> List[int]:
+        """Convert a column of element texts to integers.
+
+        Same results and warnings as calling ``to_int`` on each text, but a
+        column of valid numbers is converted in a single ``map(int, ...)``.
+
+        Args:
+            texts: Text contents to convert.
+            tag: Tag name the texts came from, used in warnings.
+            default: Default value for empty or invalid texts.
+
+        Returns:
+            List of integer values, one per text.
+        """
+        try:
+            return list(map(int, texts))
+        except ValueError:
+            # Empty or invalid entries present: fall back to the scalar path
+            return [self.to_int(text, tag, default) for text in texts]
+
+    def to_bool_batch(self, texts: Sequence[str], tag: str, default: bool = True) -> List[bool]:
+        """Convert a column of element texts to booleans.
+
+        Same results and warnings as calling ``to_bool`` on each text, but a
+        column of recognised spellings is converted with a single C-level
+        ``map`` of dictionary lookups.
+
+        Args:
+            texts: Text contents to convert.
+            tag: Tag name the texts came from, used in warnings.
+            default: Default value for unrecognised texts.
+
+        Returns:
+            List of boolean values, one per text.
+        """
+        try:
+            return list(map(_BOOL_TEXTS.__getitem__, texts))
+        except KeyError:
+            return [self.to_bool(text, tag, default) for text in texts]
 
     @abstractmethod
     def parse(self, file_path: Path) -> Any:
@@ -1,13 +1,16 @@
 """Main entry point for the database dependency analyzer CLI."""
 
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
 from database_dependency_analyzer.analyzers.dependency_analyzer import DependencyAnalyzer
 from database_dependency_analyzer.console import ArgumentParser, OutputFormatter, ProgressTracker
 from database_dependency_analyzer.models.analysis_result import AnalysisResult
+from database_dependency_analyzer.models.dependency import DependencyArrays
 from database_dependency_analyzer.parsers import (
     ObjectParser,
     TableParser,
@@ -33,6 +36,24 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
+def _parse_input(parser_class: type, method_name: str, config, file_path: Path):
+    """Parse one input file in a worker process.
+
+    Module-level so ProcessPoolExecutor can pickle it; the parser is built
+    inside the worker rather than shipped to it.
+
+    Args:
+        parser_class: Parser class to instantiate.
+        method_name: Name of the parser method to call.
+        config: Analysis configuration.
+        file_path: Path to the XML file to parse.
+
+    Returns:
+        Whatever the parser method returns.
+    """
+    return getattr(parser_class(config), method_name)(file_path)
+
+
 def load_data(config, progress_tracker: ProgressTracker) -> tuple:
     """Load and parse all input data.
 
@@ -41,34 +62,41 @@ def load_data(config, progress_tracker: ProgressTracker) -> tuple:
         progress_tracker: Progress tracker instance.
 
     Returns:
-        Tuple of (tables, objects, table_dependencies, object_dependencies).
+        Tuple of (tables, objects, table_dependencies, object_dependencies),
+        with both dependency sets as DependencyArrays.
     """
     logger = logging.getLogger(__name__)
 
-    with progress_tracker.track_operation(4, "Loading data") as progress:
-        # Parse tables
-        progress_tracker.show_message("Parsing tables...")
-        table_parser = TableParser(config)
-        tables = table_parser.parse_file(config.tables_file)
-        progress.update()
-
-        # Parse objects
-        progress_tracker.show_message("Parsing objects...")
-        object_parser = ObjectParser(config)
-        objects = object_parser.parse_file(config.objects_file)
-        progress.update()
-
-        # Parse table dependencies
-        progress_tracker.show_message("Parsing table dependencies...")
-        table_dep_parser = DependencyParser(config)
-        table_dependencies = table_dep_parser.parse_table_dependencies(config.table_dependencies_file)
-        progress.update()
-
-        # Parse object dependencies
-        progress_tracker.show_message("Parsing object dependencies...")
-        object_dep_parser = DependencyParser(config)
-        object_dependencies = object_dep_parser.parse_object_dependencies(config.object_dependencies_file)
-        progress.update()
+    # The four files are independent and parsing is CPU-bound, so parse them
+    # in separate processes. Dependencies come back as column arrays, which
+    # pickle far more cheaply than one record object per row.
+    jobs = {
+        'tables': (TableParser, 'parse', config.tables_file),
+        'objects': (ObjectParser, 'parse', config.objects_file),
+        'table dependencies': (DependencyParser, 'parse_table_dependency_arrays',
+                               config.table_dependencies_file),
+        'object dependencies': (DependencyParser, 'parse_object_dependency_arrays',
+                                config.object_dependencies_file),
+    }
+    results = {}
+    workers = max(1, min(len(jobs), config.max_workers))
+
+    with progress_tracker.track_operation(len(jobs), "Loading data"):
+        progress_tracker.show_message("Parsing input files...")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_parse_input, parser_class, method_name, config, path): name
+                for name, (parser_class, method_name, path) in jobs.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                results[name] = future.result()
+                progress_tracker.step(f"Parsed {name}")
+
+    tables = results['tables']
+    objects = results['objects']
+    table_dependencies = results['table dependencies']
+    object_dependencies = results['object dependencies']
 
     logger.info(f"Loaded {len(tables)} tables, {len(objects)} objects, "
                f"{len(table_dependencies)} table dependencies, "
@@ -78,7 +106,7 @@ def load_data(config, progress_tracker: ProgressTracker) -> tuple:
 
 
 def perform_analysis(config, tables: dict, objects: dict,
-                    table_dependencies: list, object_dependencies: list,
+                    table_dependencies: DependencyArrays, object_dependencies: DependencyArrays,
                     progress_tracker: ProgressTracker) -> AnalysisResult:
     """Perform the dependency analysis.
 
@@ -86,8 +114,8 @@ def perform_analysis(config, tables: dict, objects: dict,
         config: Analysis configuration.
         tables: Dictionary of tables.
         objects: Dictionary of objects.
-        table_dependencies: List of table dependencies.
-        object_dependencies: List of object dependencies.
+        table_dependencies: Table dependency column arrays.
+        object_dependencies: Object dependency column arrays.
         progress_tracker: Progress tracker instance.
 
     Returns:
@@ -131,12 +159,14 @@ def generate_output(config, result: AnalysisResult,
         # Security check: ensure output directory exists and is writable
         try:
             config.output_file.parent.mkdir(parents=True, exist_ok=True)
-            # Test write access
-            with open(config.output_file, 'w') as f:
-                f.write("")
-            config.output_file.unlink()  # Remove test file
-        except (OSError, PermissionError) as e:
+        except OSError as e:
             raise ValueError(f"Cannot write to output file: {config.output_file}") from e
+        # Check write access without creating and deleting a probe file: the
+        # directory must accept the file, and an existing report must be
+        # overwritable
+        if not os.access(config.output_file.parent, os.W_OK) or (
+                config.output_file.exists() and not os.access(config.output_file, os.W_OK)):
+            raise ValueError(f"Cannot write to output file: {config.output_file}")
 
         print(f"\nHTML report generation not yet implemented. Output file: {config.output_file}")
 
@@ -92,27 +92,45 @@ def sample_analysis_result(sample_tables, sample_objects, sample_table_dependenc
     return result
 
 
-@pytest.fixture
-def analysis_config(tmp_path) -> AnalysisConfig:
-    """Provide a basic analysis configuration for testing."""
-    # Create dummy XML files to satisfy file existence validation
-    (tmp_path / "tables.xml").write_text("<xml></xml>")
-    (tmp_path / "objects.xml").write_text("<xml></xml>")
-    (tmp_path / "table_deps.xml").write_text("<xml></xml>")
-    (tmp_path / "object_deps.xml").write_text("<xml></xml>")
+@pytest.fixture(scope="session")
+def dummy_input_files(tmp_path_factory) -> Tuple[Path, Path, Path, Path]:
+    """Create placeholder tables, objects, table and object dependency files once.
+
+    Their content never varies, so the whole session shares them; tests
+    must not modify them.
+    """
+    input_dir = tmp_path_factory.mktemp("inputs")
+    files = tuple(input_dir / name for name in
+                  ("tables.xml", "objects.xml", "table_deps.xml", "object_deps.xml"))
+    for f in files:
+        f.write_bytes(b"<xml></xml>")
+    return files
+
+
+@pytest.fixture(scope="session")
+def analysis_config(tmp_path_factory, dummy_input_files) -> AnalysisConfig:
+    """Provide a basic analysis configuration for testing.
+
+    Shared by the whole session; tests must not modify it.
+    """
+    # Placeholder XML files satisfy file existence validation
+    tables_file, objects_file, table_deps_file, object_deps_file = dummy_input_files
 
     return AnalysisConfig(
-        tables_file=tmp_path / "tables.xml",
-        objects_file=tmp_path / "objects.xml",
-        table_dependencies_file=tmp_path / "table_deps.xml",
-        object_dependencies_file=tmp_path / "object_deps.xml",
-        output_file=tmp_path / "report.html"
+        tables_file=tables_file,
+        objects_file=objects_file,
+        table_dependencies_file=table_deps_file,
+        object_dependencies_file=object_deps_file,
+        output_file=tmp_path_factory.mktemp("output") / "report.html"
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_files_config() -> AnalysisConfig:
-    """Provide configuration using actual sample XML files."""
+    """Provide configuration using actual sample XML files.
+
+    Shared by the whole session; tests must not modify it.
+    """
     return AnalysisConfig(
         tables_file=Path("SampleXMLFiles/Analysis_Tables.xml"),
         objects_file=Path("SampleXMLFiles/Analysis_Objects.xml"),
@@ -155,26 +173,28 @@ def sample_data_small(sample_tables, sample_objects, sample_table_dependencies,
 @pytest.fixture
 def sample_data_large() -> Tuple[Dict[int, Table], Dict[int, DatabaseObject], List[TableDependency], List[ObjectDependency]]:
     """Provide large sample dataset for performance testing."""
-    # Generate larger dataset programmatically
-    tables = {}
-    for i in range(1, 1001):  # 1000 tables
-        tables[i] = Table(table_id=i, table_name=f"Table{i}")
+    # Generate larger dataset programmatically. Dependency IDs come first so
+    # tables (which are frozen) can be created with their final usage flag.
+    # ~70% of tables are used: table i is referenced by object (i % 250) + 1
+    dep_table_ids = range(1, 701)
+    dep_object_ids = [(i % 250) + 1 for i in dep_table_ids]
+    used_table_ids = set(dep_table_ids)
+
+    tables = {
+        i: Table(table_id=i, table_name=f"Table{i}", is_used=i in used_table_ids)
+        for i in range(1, 1001)  # 1000 tables
+    }
 
     objects = {}
     object_types = ["Form", "Query", "Macro", "Report"]
     for i in range(1, 251):  # 250 objects
+        obj_type = object_types[i % len(object_types)]
         objects[i] = DatabaseObject(object_id=i, object_name=f"{obj_type}{i}", object_type=obj_type)
 
-    # Create dependencies for ~70% of tables
-    table_deps = []
-    for i in range(1, 701):
-        object_id = (i % 250) + 1
-        table_deps.append(TableDependency(object_id=object_id, table_id=i, active=True))
-
-    # Mark tables as used
-    for dep in table_deps:
-        if dep.table_id in tables:
-            tables[dep.table_id].is_used = True
+    table_deps = [
+        TableDependency(object_id=object_id, table_id=table_id, active=True)
+        for object_id, table_id in zip(dep_object_ids, dep_table_ids)
+    ]
 
     object_deps = []
     for i in range(1, 101):  # 100 object dependencies
@@ -97,4 +97,31 @@ class TestFullAnalysisIntegration:
             assert results[i].statistics.used_tables == results[0].statistics.used_tables
             assert results[i].statistics.unused_tables == results[0].statistics.unused_tables
             assert results[i].statistics.total_dependencies == results[0].statistics.total_dependencies
-            assert results[i].statistics.active_dependencies == results[0].statistics.active_dependencies
\ No newline at end of file
+            assert results[i].statistics.active_dependencies == results[0].statistics.active_dependencies
+
+    def test_analysis_with_dependency_arrays(self, sample_files_config):
+        """Test that column-array dependencies give the same analysis as records."""
+        tables = TableParser(sample_files_config).parse(sample_files_config.tables_file)
+        objects = ObjectParser(sample_files_config).parse(sample_files_config.objects_file)
+        dependency_parser = DependencyParser(sample_files_config)
+
+        table_records = dependency_parser.parse_table_dependencies(
+            sample_files_config.table_dependencies_file)
+        object_records = dependency_parser.parse_object_dependencies(
+            sample_files_config.object_dependencies_file)
+        table_arrays = dependency_parser.parse_table_dependency_arrays(
+            sample_files_config.table_dependencies_file)
+        object_arrays = dependency_parser.parse_object_dependency_arrays(
+            sample_files_config.object_dependencies_file)
+
+        assert len(table_arrays) == len(table_records)
+        assert len(object_arrays) == len(object_records)
+        assert list(table_arrays.sources) == [dep.object_id for dep in table_records]
+        assert list(object_arrays.targets) == [dep.target_object_id for dep in object_records]
+
+        analyzer = DependencyAnalyzer(sample_files_config)
+        from_records = analyzer.analyze(tables, objects, table_records, object_records)
+        from_arrays = analyzer.analyze(tables, objects, table_arrays, object_arrays)
+
+        assert from_arrays.tables == from_records.tables
+        assert from_arrays.statistics == from_records.statistics
\ No newline at end of file
@@ -19,18 +19,15 @@ class TestDependencyAnalyzer:
     @pytest.fixture
     def config(self, tmp_path):
         """Create a mock configuration for testing."""
-        # Create dummy XML files
-        (tmp_path / "tables.xml").write_text("<xml></xml>")
-        (tmp_path / "objects.xml").write_text("<xml></xml>")
-        (tmp_path / "table_deps.xml").write_text("<xml></xml>")
-        (tmp_path / "object_deps.xml").write_text("<xml></xml>")
-
+        # The analyzer is handed parsed data and never opens the input
+        # files, so they need not exist
         return AnalysisConfig(
             tables_file=tmp_path / "tables.xml",
             objects_file=tmp_path / "objects.xml",
             table_dependencies_file=tmp_path / "table_deps.xml",
             object_dependencies_file=tmp_path / "object_deps.xml",
-            output_file=tmp_path / "report.html"
+            output_file=tmp_path / "report.html",
+            validate_paths=False
         )
     
     @pytest.fixture
@@ -123,6 +120,23 @@ class TestDependencyAnalyzer:
         customer_refs = [ref.object_name for ref in customers.referencing_objects]
         assert "OrderQuery" in customer_refs
     
+    def test_all_references_recorded(self, analyzer, sample_tables, sample_objects,
+                                     sample_table_dependencies):
+        """Test that every active referencing object is recorded once per table."""
+        duplicated = sample_table_dependencies + [
+            TableDependency(object_id=100, table_id=1, active=True)
+        ]
+        result = analyzer.analyze(
+            tables=sample_tables,
+            objects=sample_objects,
+            table_dependencies=duplicated,
+            object_dependencies=[]
+        )
+        
+        assert [ref.object_id for ref in result.tables[1].referencing_objects] == [100, 101]
+        assert [ref.object_id for ref in result.tables[2].referencing_objects] == [101]
+        assert [ref.object_id for ref in result.tables[3].referencing_objects] == [102]
+    
     def test_transitive_dependencies(self, analyzer, sample_tables, sample_objects, 
                                    sample_table_dependencies, sample_object_dependencies):
         """Test transitive dependencies through object chains."""
@@ -205,6 +219,19 @@ class TestDependencyAnalyzer:
         assert result.statistics.total_tables == 100
         assert result.statistics.used_tables == 25  # First 25 tables used
         assert result.statistics.unused_tables == 75  # Remaining 75 unused
+
+    def test_analyze_sample_data_large(self, analyzer, sample_data_large):
+        """Test analysis of the shared large sample dataset."""
+        tables, objects, table_deps, object_deps = sample_data_large
+
+        result = analyzer.analyze(tables, objects, table_deps, object_deps)
+
+        assert result.statistics.total_tables == 1000
+        assert result.statistics.used_tables == 700
+        assert result.statistics.total_objects == 250
+        assert result.statistics.object_type_distribution == {
+            "Form": 62, "Query": 63, "Macro": 63, "Report": 62
+        }
     
     def test_get_unused_tables(self, analyzer, sample_tables, sample_objects, 
                               sample_table_dependencies, sample_object_dependencies):
@@ -235,4 +262,43 @@ class TestDependencyAnalyzer:
         assert len(used_tables) == 3
         used_table_names = {table.table_name for table in used_tables}
         assert used_table_names == {"Customers", "Orders", "Products"}
-        assert all(table.is_used for table in used_tables)
\ No newline at end of file
+        assert all(table.is_used for table in used_tables)
+    
+    def test_get_table_by_name(self, analyzer, sample_tables, sample_objects, 
+                               sample_table_dependencies, sample_object_dependencies):
+        """Test case-insensitive table lookup by name."""
+        result = analyzer.analyze(
+            tables=sample_tables,
+            objects=sample_objects,
+            table_dependencies=sample_table_dependencies,
+            object_dependencies=sample_object_dependencies
+        )
+        
+        assert result.get_table_by_name("Orders").table_id == 2
+        assert result.get_table_by_name("CUSTOMERS").table_id == 1
+        assert result.get_table_by_name("unusedtable").table_id == 4
+        assert result.get_table_by_name("Missing") is None
+    
+    def test_table_add_reference_dedup(self):
+        """Test that add_reference ignores repeat references by object ID."""
+        table = Table(table_id=1, table_name="Customers")
+        table.add_reference(ObjectReference(object_id=10, object_name="frmA", object_type="Form"))
+        table.add_reference(ObjectReference(object_id=10, object_name="frmA", object_type="Form"))
+        table.add_reference(ObjectReference(object_id=11, object_name="qryB", object_type="Query"))
+        
+        assert [ref.object_id for ref in table.referencing_objects] == [10, 11]
+        assert table.is_used
+    
+    def test_table_add_reference_merges_active_flag(self):
+        """Test a later active reference activates an earlier inactive one."""
+        table = Table(table_id=1, table_name="Customers")
+        table.add_reference(ObjectReference(object_id=10, object_name="frmA", object_type="Form", active=False))
+        assert not table.is_used
+        
+        table.add_reference(ObjectReference(object_id=10, object_name="frmA", object_type="Form", active=True))
+        table.add_reference(ObjectReference(object_id=10, object_name="frmA", object_type="Form", active=False))
+        
+        assert table.referencing_objects == [
+            ObjectReference(object_id=10, object_name="frmA", object_type="Form", active=True)
+        ]
+        assert table.is_used
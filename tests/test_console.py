@@ -15,18 +15,11 @@ from database_dependency_analyzer.models.table import Table
 class TestArgumentParser:
     """Test cases for ArgumentParser."""
 
-    def test_parse_args_required_files(self, tmp_path):
+    def test_parse_args_required_files(self, dummy_input_files):
         """Test parsing with required file arguments."""
         parser = ArgumentParser()
 
-        tables_file = tmp_path / "tables.xml"
-        objects_file = tmp_path / "objects.xml"
-        table_deps_file = tmp_path / "table_deps.xml"
-        object_deps_file = tmp_path / "object_deps.xml"
-
-        # Create dummy files
-        for f in [tables_file, objects_file, table_deps_file, object_deps_file]:
-            f.write_text("<xml></xml>")
+        tables_file, objects_file, table_deps_file, object_deps_file = dummy_input_files
 
         args = parser.parse_args([
             str(tables_file),
@@ -46,19 +39,12 @@ class TestArgumentParser:
         assert args.max_workers == 4
         assert args.memory_limit == 512
 
-    def test_parse_args_with_options(self, tmp_path):
+    def test_parse_args_with_options(self, dummy_input_files):
         """Test parsing with optional arguments."""
         parser = ArgumentParser()
 
-        tables_file = tmp_path / "tables.xml"
-        objects_file = tmp_path / "objects.xml"
-        table_deps_file = tmp_path / "table_deps.xml"
-        object_deps_file = tmp_path / "object_deps.xml"
-        output_file = tmp_path / "report.html"
-
-        # Create dummy files
-        for f in [tables_file, objects_file, table_deps_file, object_deps_file]:
-            f.write_text("<xml></xml>")
+        tables_file, objects_file, table_deps_file, object_deps_file = dummy_input_files
+        output_file = tables_file.parent / "report.html"
 
         args = parser.parse_args([
             str(tables_file),
@@ -252,6 +238,17 @@ class TestProgressTracker:
         assert "50/100" in caplog.records[0].message
         assert "Test message" in caplog.records[0].message
 
+    def test_log_progress_rate_limited(self, caplog):
+        """Test that intermediate progress messages are rate-limited."""
+        tracker = ProgressTracker(enabled=True, log_interval=60.0)
+
+        with caplog.at_level(logging.INFO):
+            for current in range(1, 101):
+                tracker.log_progress(current, 100)
+
+        messages = [record.message for record in caplog.records]
+        assert messages == ["Progress: 1/100 (1.0%)", "Progress: 100/100 (100.0%)"]
+
     def test_show_message(self):
         """Test showing messages."""
         tracker = ProgressTracker(enabled=True)
@@ -266,6 +263,18 @@ class TestProgressTracker:
             tracker.show_message("Error message", "error")
             mock_print.assert_called_with("❌ Error message")
 
+    def test_step_batches_stage_lines(self, capsys):
+        """Test that step lines are written once the operation finishes."""
+        tracker = ProgressTracker(enabled=True)
+        tracker.start_operation(2, "Loading")
+
+        tracker.step("Parsed tables")
+        assert capsys.readouterr().err == ""
+
+        tracker.step("Parsed objects")
+        tracker.finish_operation()
+        assert capsys.readouterr().err == "[1/2] Parsed tables\n[2/2] Parsed objects\n"
+
     def test_create_subtracker(self):
         """Test creating sub-trackers."""
         tracker = ProgressTracker(enabled=True, verbose=True)
@@ -0,0 +1,237 @@
+"""Unit tests for the test data factories."""
+
+import random
+from types import MappingProxyType
+
+import pytest
+
+from database_dependency_analyzer.models.dependency import TableDependency, ObjectDependency
+from database_dependency_analyzer.models.object import DatabaseObject
+from database_dependency_analyzer.models.table import Table
+from tests.utils.data_factory import (
+    AnalysisResultFactory,
+    DatabaseObjectFactory,
+    DependencyFactory,
+    ObjectReferenceFactory,
+    TableFactory,
+    copy_dataset,
+    create_edge_case_dataset,
+    create_test_dataset,
+    create_test_dataset_seeded,
+    _realistic_result_prototype,
+)
+
+
+class TestModelFactories:
+    """Test suite for the table, object and reference factories."""
+
+    def test_create_tables(self):
+        """Test tables are numbered from the start ID and default to unused."""
+        tables = TableFactory.create_tables(3, start_id=5)
+
+        assert list(tables) == [5, 6, 7]
+        assert tables[6].table_name == "Table6"
+        assert not any(t.is_used for t in tables.values())
+        assert TableFactory.create_table(1, "Used", is_used=True).is_used
+
+    def test_create_realistic_tables(self):
+        """Test realistic tables are fresh instances numbered from 1."""
+        tables = TableFactory.create_realistic_tables()
+
+        assert len(tables) == 18
+        assert tables[1].table_name == "Customers"
+        assert tables[18].table_name == "Transactions"
+        assert TableFactory.create_realistic_tables() is not tables
+
+    def test_create_objects_cycles_types(self):
+        """Test generated objects cycle through every object type."""
+        objects = DatabaseObjectFactory.create_objects(5, start_id=100)
+
+        assert [o.object_type for o in objects.values()] == ["Form", "Query", "Macro", "Report", "Form"]
+        assert objects[101].object_name == "Query101"
+
+    def test_create_realistic_objects(self):
+        """Test realistic objects keep their fixed IDs, names and types."""
+        objects = DatabaseObjectFactory.create_realistic_objects()
+
+        assert list(objects) == list(range(100, 111))
+        assert objects[103] == DatabaseObject(103, "CustomerQuery", "Query")
+
+    def test_create_references(self):
+        """Test references are built from objects and active by default."""
+        objects = DatabaseObjectFactory.create_objects(2)
+
+        refs = ObjectReferenceFactory.create_from_objects(objects)
+
+        assert [r.object_id for r in refs] == [100, 101]
+        assert all(r.active for r in refs)
+        assert not ObjectReferenceFactory.create_reference(1, "Form1", "Form", False).active
+
+
+class TestDependencyFactory:
+    """Test suite for DependencyFactory."""
+
+    def test_create_dependencies(self):
+        """Test factory flags map onto the dependency models."""
+        assert DependencyFactory.create_table_dependency(100, 1, False) == TableDependency(100, 1, False)
+        assert DependencyFactory.create_object_dependency(100, 101) == ObjectDependency(100, 101, True)
+
+    def test_random_dependencies_reference_known_ids(self):
+        """Test random dependencies use known IDs and never link an object to itself."""
+        tables = TableFactory.create_tables(50)
+        objects = DatabaseObjectFactory.create_objects(30)
+
+        table_deps, object_deps = DependencyFactory.create_random_dependencies(
+            objects, tables, 0.5, random.Random(1)
+        )
+
+        assert all(d.table_id in tables and d.object_id in objects for d in table_deps)
+        assert len(object_deps) == 10
+        for dep in object_deps:
+            assert dep.source_object_id in objects and dep.target_object_id in objects
+            assert dep.source_object_id != dep.target_object_id
+
+    def test_random_dependencies_are_reproducible(self):
+        """Test the same seed draws the same dependencies."""
+        tables = TableFactory.create_tables(20)
+        objects = DatabaseObjectFactory.create_objects(15)
+
+        first = DependencyFactory.create_random_dependencies(objects, tables, rng=random.Random(7))
+        second = DependencyFactory.create_random_dependencies(objects, tables, rng=random.Random(7))
+
+        assert first == second
+
+
+class TestDatasets:
+    """Test suite for the dataset builders."""
+
+    @pytest.mark.parametrize("size,table_count,object_count", [
+        ("small", 5, 4),
+        ("large", 100, 50),
+    ])
+    def test_create_test_dataset(self, size, table_count, object_count):
+        """Test each size builds the expected number of tables and objects."""
+        tables, objects, table_deps, object_deps = create_test_dataset(size, random.Random(0))
+
+        assert len(tables) == table_count
+        assert len(objects) == object_count
+        assert all(d.table_id in tables for d in table_deps)
+        assert len(object_deps) == object_count // 3
+
+    def test_unknown_size(self):
+        """Test an unknown size is rejected."""
+        with pytest.raises(ValueError, match="Unknown size: huge"):
+            create_test_dataset("huge")
+
+    def test_seeded_dataset_is_cached_and_read_only(self):
+        """Test seeded datasets are generated once and returned read-only."""
+        dataset = create_test_dataset_seeded("small", 3)
+
+        assert create_test_dataset_seeded("small", 3) is dataset
+        tables, objects, table_deps, object_deps = dataset
+        assert isinstance(tables, MappingProxyType)
+        assert isinstance(objects, MappingProxyType)
+        assert isinstance(table_deps, tuple) and isinstance(object_deps, tuple)
+        with pytest.raises(TypeError):
+            tables[99] = Table(99, "Extra")
+
+    def test_seeded_dataset_matches_unseeded_builder(self):
+        """Test a seeded dataset matches create_test_dataset with the same seed."""
+        expected = create_test_dataset("large", random.Random(5))
+
+        assert copy_dataset(create_test_dataset_seeded("large", 5)) == expected
+
+    def test_copy_dataset_is_mutable(self):
+        """Test copies can be modified without touching the cached dataset."""
+        dataset = create_test_dataset_seeded("small", 4)
+
+        tables, objects, table_deps, object_deps = copy_dataset(dataset)
+        tables.clear()
+        table_deps.append(TableDependency(100, 1))
+
+        assert len(dataset[0]) == 5
+        assert len(dataset[2]) == len(table_deps) - 1
+
+    @pytest.mark.parametrize("case,sizes", [
+        ("empty", (0, 0, 0, 0)),
+        ("no_dependencies", (5, 3, 0, 0)),
+        ("circular_deps", (2, 3, 1, 3)),
+        ("duplicate_ids", (1, 1, 2, 0)),
+    ])
+    def test_edge_case_dataset(self, case, sizes):
+        """Test every edge case builds its data."""
+        assert tuple(map(len, create_edge_case_dataset(case))) == sizes
+
+    def test_unknown_edge_case(self):
+        """Test an unknown edge case is rejected."""
+        with pytest.raises(ValueError, match="Unknown edge case: missing"):
+            create_edge_case_dataset("missing")
+
+
+class TestAnalysisResultFactory:
+    """Test suite for AnalysisResultFactory."""
+
+    def test_create_from_data(self):
+        """Test tables with active dependencies are marked used in a copy."""
+        tables = {1: Table(1, "Customers"), 2: Table(2, "Orders"), 3: Table(3, "Archive")}
+        objects = {100: DatabaseObject(100, "CustomerForm", "Form")}
+        table_deps = [TableDependency(100, 1, True), TableDependency(100, 2, False)]
+        object_deps = [ObjectDependency(100, 100, True)]
+
+        result = AnalysisResultFactory.create_from_data(tables, objects, table_deps, object_deps)
+
+        assert [t.table_id for t in result.get_used_tables()] == [1]
+        assert not tables[1].is_used
+        assert result.tables is not tables
+        assert result.statistics.total_tables == 3
+        assert result.statistics.used_tables == 1
+        assert result.statistics.unused_table_ids == [2, 3]
+        assert result.statistics.total_objects == 1
+        assert result.statistics.active_dependencies == 1
+        assert result.table_dependencies == table_deps
+        assert result.object_dependencies == object_deps
+
+    def test_realistic_result_is_built_once_per_seed(self):
+        """Test each seed is generated once and handed out as equal copies."""
+        _realistic_result_prototype.cache_clear()
+
+        first = AnalysisResultFactory.create_realistic_result(seed=11)
+        second = AnalysisResultFactory.create_realistic_result(seed=11)
+
+        assert _realistic_result_prototype.cache_info().misses == 1
+        assert first is not second
+        assert first.tables == second.tables
+        assert first.statistics == second.statistics
+        assert first.table_dependencies == second.table_dependencies
+
+    def test_realistic_result_copies_are_independent(self):
+        """Test changes to one copy do not reach the cached prototype."""
+        first = AnalysisResultFactory.create_realistic_result(seed=12)
+        expected_unused = [t.table_id for t in first.get_unused_tables()]
+
+        first.tables.clear()
+        first.table_dependencies.clear()
+        first.statistics.unused_table_ids.clear()
+
+        second = AnalysisResultFactory.create_realistic_result(seed=12)
+        assert len(second.tables) == 18
+        assert second.table_dependencies
+        assert [t.table_id for t in second.get_unused_tables()] == expected_unused
+        assert second.statistics.unused_table_ids == expected_unused
+
+    def test_realistic_result_without_seed(self):
+        """Test seed=None draws a fresh result from the realistic data."""
+        result = AnalysisResultFactory.create_realistic_result(seed=None)
+
+        assert len(result.tables) == 18
+        assert len(result.objects) == 11
+        used = {d.table_id for d in result.table_dependencies if d.active}
+        assert {t.table_id for t in result.get_used_tables()} == used
+
+    def test_create_empty_result(self):
+        """Test the empty result has no data and zeroed statistics."""
+        result = AnalysisResultFactory.create_empty_result()
+
+        assert result.tables == {}
+        assert result.objects == {}
+        assert result.statistics.total_tables == 0
@@ -0,0 +1,215 @@
+"""Unit tests for the HTMLGenerator class."""
+
+import json
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from database_dependency_analyzer.generators.html_generator import HTMLGenerator, _DIAGRAM_NODE_COLORS
+from database_dependency_analyzer.models.analysis_result import AnalysisResult, AnalysisStatistics
+from database_dependency_analyzer.models.object import DatabaseObject
+from database_dependency_analyzer.models.table import Table, ObjectReference
+
+
+# Stand-in DOM for running the report script under node: every element is
+# a stub that accepts any call or assignment and records the event types
+# passed to addEventListener. The embedded JSON is exposed as DATA and
+# elements placed in ``elements`` are returned by getElementById instead.
+_DOM_STUB = """
+const listeners = [];
+const elements = {};
+const stub = () => new Proxy(function () {}, {
+    get(target, prop) {
+        if (prop === 'addEventListener') return type => listeners.push(type);
+        if (prop === Symbol.toPrimitive) return () => 0;
+        if (prop === 'then') return undefined;
+        if (prop === 'length') return 0;
+        if (prop === 'forEach') return () => {};
+        return stub();
+    },
+    set() { return true; },
+    apply() { return stub(); },
+    construct() { return stub(); }
+});
+const page = stub();
+const window = stub();
+const document = new Proxy({}, {
+    get(target, prop) {
+        if (prop === 'getElementById') {
+            return id => elements[id] || (id === 'analysis-data' ? { textContent: DATA } : page);
+        }
+        return page[prop];
+    }
+});
+"""
+
+# Prints the nodes the script's diagram would draw with every filter on
+_DIAGRAM_NODES = """
+const controller = Object.create(ReportController.prototype);
+controller.data = JSON.parse(DATA);
+controller.initDependencyDiagram();
+controller.prepareDiagramLabels();
+console.log(JSON.stringify(
+    controller.buildDiagramNodes().map(node => [node.x, node.y + 4, node._displayEsc])
+));
+"""
+
+# Prints the listeners attached before and after the data has loaded
+_LISTENERS_BY_STAGE = """
+const controller = new ReportController();
+const before = listeners.slice();
+controller.ready.then(() => console.log(JSON.stringify([before, listeners])));
+"""
+
+# Prints the rows a 640px-tall scroller renders for 100 tables
+_ROWS_IN_SCROLLER = """
+const rows = [];
+elements['table-body'] = { innerHTML: '', appendChild() {} };
+elements['table-scroll'] = { scrollTop: 0, clientHeight: 640 };
+const controller = Object.create(ReportController.prototype);
+controller.visibleTables = Array.from({ length: 100 }, (_, i) => ({ table_id: i }));
+controller.createTableRow = table => rows.push(table.table_id);
+controller.renderVisibleRows();
+console.log(JSON.stringify(rows));
+"""
+
+# Workers that fail to start or fail while parsing, for the parse fallbacks
+_FAILING_WORKERS = {
+    "unavailable": "",
+    "erroring": """
+globalThis.Worker = class {
+    postMessage() { setTimeout(() => this.onerror(new Error('worker failed'))); }
+    terminate() {}
+};
+""",
+}
+
+# Prints the listeners and table body once loading malformed data settles
+_LOAD_MALFORMED_DATA = """
+elements['analysis-data'] = { textContent: '{"tables": ' };
+elements['table-body'] = { innerHTML: '' };
+console.error = () => {};
+const controller = new ReportController();
+controller.ready.then(() => console.log(JSON.stringify([listeners, elements['table-body'].innerHTML])));
+"""
+
+requires_node = pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+
+
+def _run_report_script(report: str, code: str) -> str:
+    """Run a report's embedded script followed by ``code`` under node."""
+    script = re.search(r"<script>(.*?)</script>", report, re.S).group(1)
+    data = re.search(r'<script type="application/json" id="analysis-data">(.*?)</script>',
+                     report, re.S).group(1)
+    source = f"const DATA = {json.dumps(data)};\n{_DOM_STUB}{script}{code}"
+    return subprocess.run(["node"], input=source, capture_output=True,
+                          text=True, check=True).stdout
+
+
+class TestHTMLGenerator:
+    """Test suite for HTMLGenerator class."""
+
+    @pytest.fixture
+    def analysis_result(self):
+        """Create a result with one object of every type referencing a table."""
+        objects = {
+            100: DatabaseObject(100, "CustomerForm", "Form"),
+            101: DatabaseObject(101, "CustomerQuery", "Query"),
+            102: DatabaseObject(102, "CleanupMacro", "Macro"),
+            103: DatabaseObject(103, "SalesReport", "Report"),
+        }
+        refs = [
+            ObjectReference(obj.object_id, obj.object_name, obj.object_type, True)
+            for obj in objects.values()
+        ]
+        tables = {
+            1: Table(1, "Customers", True, refs),
+            2: Table(2, "Archive", False),
+        }
+        statistics = AnalysisStatistics(
+            total_tables=2,
+            used_tables=1,
+            unused_tables=1,
+            total_objects=4,
+            object_type_distribution={"Form": 1, "Query": 1, "Macro": 1, "Report": 1},
+            total_dependencies=4,
+            active_dependencies=4,
+            unused_table_ids=[2]
+        )
+        return AnalysisResult(tables=tables, objects=objects,
+                              statistics=statistics, processing_time=0.1)
+
+    def test_diagram_filters_cover_every_object_type(self, analysis_result):
+        """Test each object column has a filter checkbox the script knows about."""
+        report = HTMLGenerator(analysis_result).generate_html()
+
+        columns = json.loads(re.search(r"const DIAGRAM_OBJECT_COLUMNS = (.*);", report).group(1))
+        assert {column["type"]: column["filter"] for column in columns}["Query"] == "queries"
+        for column in columns:
+            assert f'id="show-{column["filter"]}"' in report
+
+    def test_script_uses_server_node_colors(self, analysis_result):
+        """Test the script's diagram colors come from the server's palette."""
+        report = HTMLGenerator(analysis_result).generate_html()
+
+        colors = json.loads(re.search(r"const DIAGRAM_NODE_COLORS = (.*);", report).group(1))
+        assert colors == _DIAGRAM_NODE_COLORS
+
+    def test_server_diagram_shows_query_nodes(self, analysis_result):
+        """Test the pre-rendered diagram includes Query objects."""
+        svg = HTMLGenerator(analysis_result)._render_diagram_svg()
+
+        assert ">CustomerQuery</text>" in svg
+        assert 'fill="#f59e0b"' in svg
+
+    @requires_node
+    def test_script_diagram_matches_server_diagram(self, analysis_result):
+        """Test the script's redraw places the same nodes as the server render."""
+        generator = HTMLGenerator(analysis_result)
+        output = _run_report_script(generator.generate_html(), _DIAGRAM_NODES)
+        script_nodes = [tuple(node) for node in json.loads(output)]
+
+        svg = generator._render_diagram_svg()
+        server_nodes = [
+            (int(x), int(y), label)
+            for x, y, label in re.findall(r'<text x="(\d+)" y="(\d+)"[^>]*>([^<]*)</text>', svg)
+        ]
+        assert script_nodes == server_nodes
+        assert any(x == 500 and label == "CustomerQuery" for x, _, label in script_nodes)
+
+    @requires_node
+    def test_handlers_attached_after_data_loads(self, analysis_result):
+        """Test no control handler can run before the report data is loaded."""
+        report = HTMLGenerator(analysis_result).generate_html()
+
+        output = _run_report_script(report, _LISTENERS_BY_STAGE)
+        # The script logs its own render message first
+        before, after = json.loads(output.splitlines()[-1])
+
+        # Only the page's own DOMContentLoaded hook exists up front
+        assert before == ["DOMContentLoaded"]
+        assert {"input", "change", "click", "scroll"} <= set(after)
+
+    @requires_node
+    def test_row_window_sized_from_scroller(self, analysis_result):
+        """Test the rendered rows fill the scroll container, not the window."""
+        report = HTMLGenerator(analysis_result).generate_html()
+
+        rows = json.loads(_run_report_script(report, _ROWS_IN_SCROLLER).splitlines()[-1])
+
+        # 640px / 64px rows, plus the overscan
+        assert rows == list(range(10 + 10))
+
+    @requires_node
+    @pytest.mark.parametrize("worker", sorted(_FAILING_WORKERS))
+    def test_malformed_data_shows_load_error(self, analysis_result, worker):
+        """Test a parse failure on the fallback path settles with an error state."""
+        report = HTMLGenerator(analysis_result).generate_html()
+
+        output = _run_report_script(report, _FAILING_WORKERS[worker] + _LOAD_MALFORMED_DATA)
+        listeners, body = json.loads(output.splitlines()[-1])
+
+        assert listeners == ["DOMContentLoaded"]
+        assert "Report data could not be loaded." in body
@@ -0,0 +1,109 @@
+"""Unit tests for the CLI entry point in src/main.py."""
+
+import importlib
+import sys
+import types
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from database_dependency_analyzer.console.progress_tracker import ProgressTracker
+from database_dependency_analyzer.models.config import AnalysisConfig
+from database_dependency_analyzer.models.dependency import DependencyArrays
+
+
+SAMPLE_DIR = Path(__file__).parent.parent / "SampleXMLFiles"
+
+
+@pytest.fixture
+def main_module():
+    """Import src.main with its ConfigManager module stubbed out.
+
+    The CLI helpers under test do not use ConfigManager, so a stand-in
+    module keeps them importable independently of src/config.py.
+    """
+    config_stub = types.ModuleType("src.config")
+    config_stub.ConfigManager = object
+    with patch.dict(sys.modules, {"src.config": config_stub}):
+        sys.modules.pop("src.main", None)
+        yield importlib.import_module("src.main")
+
+
+@pytest.fixture
+def sample_config():
+    """Provide a configuration pointing at the sample XML files."""
+    return AnalysisConfig(
+        tables_file=SAMPLE_DIR / "Analysis_Tables.xml",
+        objects_file=SAMPLE_DIR / "Analysis_Objects.xml",
+        table_dependencies_file=SAMPLE_DIR / "Analysis_TableDependencies.xml",
+        object_dependencies_file=SAMPLE_DIR / "Analysis_ObjectDependencies.xml",
+        console_output=False,
+        max_workers=2
+    )
+
+
+class TestLoadData:
+    """Test cases for load_data."""
+
+    def test_load_sample_files(self, main_module, sample_config):
+        """Test the four sample files are parsed in worker processes."""
+        tracker = ProgressTracker(enabled=False)
+
+        with patch.object(tracker, "step", wraps=tracker.step) as step:
+            tables, objects, table_deps, object_deps = main_module.load_data(sample_config, tracker)
+
+        assert len(tables) == 246
+        assert len(objects) == 1312
+        assert isinstance(table_deps, DependencyArrays)
+        assert isinstance(object_deps, DependencyArrays)
+        assert len(table_deps) == 119
+        assert len(object_deps) == 1005
+        # One step per parsed file
+        assert step.call_count == 4
+
+    @pytest.mark.parametrize("max_workers,expected", [(0, 1), (2, 2), (16, 4)])
+    def test_worker_count(self, main_module, sample_config, max_workers, expected):
+        """Test the pool has at least one worker and no more than one per file."""
+        sample_config.max_workers = max_workers
+
+        with patch.object(main_module, "ProcessPoolExecutor", wraps=ProcessPoolExecutor) as pool:
+            main_module.load_data(sample_config, ProgressTracker(enabled=False))
+
+        pool.assert_called_once_with(max_workers=expected)
+
+
+class TestGenerateOutput:
+    """Test cases for generate_output."""
+
+    def test_creates_missing_output_directory(self, main_module, sample_config, tmp_path):
+        """Test missing parent directories of the output file are created."""
+        sample_config.output_file = tmp_path / "reports" / "2024" / "report.html"
+
+        main_module.generate_output(sample_config, None, None)
+
+        assert sample_config.output_file.parent.is_dir()
+
+    def test_keeps_existing_output_file(self, main_module, sample_config, tmp_path):
+        """Test the write check leaves an existing report untouched."""
+        sample_config.output_file = tmp_path / "report.html"
+        sample_config.output_file.write_text("previous report")
+
+        main_module.generate_output(sample_config, None, None)
+
+        assert sample_config.output_file.read_text() == "previous report"
+
+    def test_read_only_output_file(self, main_module, sample_config, tmp_path, monkeypatch):
+        """Test an existing output file that cannot be written is rejected."""
+        output_file = tmp_path / "report.html"
+        output_file.write_text("previous report")
+        sample_config.output_file = output_file
+        real_access = main_module.os.access
+        monkeypatch.setattr(
+            main_module.os, "access",
+            lambda path, mode: False if Path(path) == output_file else real_access(path, mode)
+        )
+
+        with pytest.raises(ValueError, match="Cannot write to output file"):
+            main_module.generate_output(sample_config, None, None)
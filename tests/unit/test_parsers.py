@@ -5,7 +5,6 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
-from database_dependency_analyzer.models.config import AnalysisConfig
 from tests.conftest import analysis_config
 from src.database_dependency_analyzer.parsers.xml_parser import BaseXMLParser, XMLParseError
 from src.database_dependency_analyzer.parsers.table_parser import TableParser
@@ -34,48 +33,24 @@ class TestBaseXMLParser:
         assert tree is not None
         assert tree.getroot().tag == "dataroot"
 
-    def test_parse_file_not_found(self, tmp_path):
+    def test_parse_file_not_found(self, tmp_path, analysis_config):
         """Test parsing non-existent file."""
-        # Create dummy config files
-        (tmp_path / "tables.xml").write_text("<xml></xml>")
-        (tmp_path / "objects.xml").write_text("<xml></xml>")
-        (tmp_path / "table_deps.xml").write_text("<xml></xml>")
-        (tmp_path / "object_deps.xml").write_text("<xml></xml>")
-
-        config = AnalysisConfig(
-            tables_file=tmp_path / "tables.xml",
-            objects_file=tmp_path / "objects.xml",
-            table_dependencies_file=tmp_path / "table_deps.xml",
-            object_dependencies_file=tmp_path / "object_deps.xml"
-        )
-        parser = TableParser(config)
+        parser = TableParser(analysis_config)
 
         with pytest.raises(FileNotFoundError):
             parser.parse_file(Path("nonexistent.xml"))
 
-    def test_parse_malformed_xml(self, tmp_path):
+    def test_parse_malformed_xml(self, tmp_path, analysis_config):
         """Test parsing malformed XML."""
         xml_file = tmp_path / "malformed.xml"
         xml_file.write_text("<invalid>")
 
-        # Create dummy config files
-        (tmp_path / "tables.xml").write_text("<xml></xml>")
-        (tmp_path / "objects.xml").write_text("<xml></xml>")
-        (tmp_path / "table_deps.xml").write_text("<xml></xml>")
-        (tmp_path / "object_deps.xml").write_text("<xml></xml>")
-
-        config = AnalysisConfig(
-            tables_file=tmp_path / "tables.xml",
-            objects_file=tmp_path / "objects.xml",
-            table_dependencies_file=tmp_path / "table_deps.xml",
-            object_dependencies_file=tmp_path / "object_deps.xml"
-        )
-        parser = TableParser(config)
+        parser = TableParser(analysis_config)
 
         with pytest.raises(XMLParseError):
             parser.parse_file(xml_file)
 
-    def test_find_elements_namespaced(self, tmp_path):
+    def test_find_elements_namespaced(self, tmp_path, analysis_config):
         """Test finding elements with namespace."""
         xml_content = """<?xml version="1.0"?>
         <dataroot xmlns:od="urn:schemas-microsoft-com:officedata">
@@ -87,26 +62,14 @@ class TestBaseXMLParser:
         xml_file = tmp_path / "namespaced.xml"
         xml_file.write_text(xml_content)
 
-        # Create dummy config files
-        (tmp_path / "tables.xml").write_text("<xml></xml>")
-        (tmp_path / "objects.xml").write_text("<xml></xml>")
-        (tmp_path / "table_deps.xml").write_text("<xml></xml>")
-        (tmp_path / "object_deps.xml").write_text("<xml></xml>")
-
-        config = AnalysisConfig(
-            tables_file=tmp_path / "tables.xml",
-            objects_file=tmp_path / "objects.xml",
-            table_dependencies_file=tmp_path / "table_deps.xml",
-            object_dependencies_file=tmp_path / "object_deps.xml"
-        )
-        parser = TableParser(config)
+        parser = TableParser(analysis_config)
         tree = parser.parse_file(xml_file)
         root = tree.getroot()
 
         elements = parser.find_elements(root, 'Analysis_Tables')
         assert len(elements) == 1
 
-    def test_find_elements_non_namespaced_fallback(self, tmp_path):
+    def test_find_elements_non_namespaced_fallback(self, tmp_path, analysis_config):
         """Test fallback to non-namespaced elements."""
         xml_content = """<?xml version="1.0"?>
         <dataroot>
@@ -118,26 +81,14 @@ class TestBaseXMLParser:
         xml_file = tmp_path / "non_namespaced.xml"
         xml_file.write_text(xml_content)
 
-        # Create dummy config files
-        (tmp_path / "tables.xml").write_text("<xml></xml>")
-        (tmp_path / "objects.xml").write_text("<xml></xml>")
-        (tmp_path / "table_deps.xml").write_text("<xml></xml>")
-        (tmp_path / "object_deps.xml").write_text("<xml></xml>")
-
-        config = AnalysisConfig(
-            tables_file=tmp_path / "tables.xml",
-            objects_file=tmp_path / "objects.xml",
-            table_dependencies_file=tmp_path / "table_deps.xml",
-            object_dependencies_file=tmp_path / "object_deps.xml"
-        )
-        parser = TableParser(config)
+        parser = TableParser(analysis_config)
         tree = parser.parse_file(xml_file)
         root = tree.getroot()
 
         elements = parser.find_elements(root, 'Analysis_Tables')
         assert len(elements) == 1
 
-    def test_get_text_namespaced(self, tmp_path):
+    def test_get_text_namespaced(self, tmp_path, analysis_config):
         """Test getting text from namespaced elements."""
         xml_content = """<?xml version="1.0"?>
         <dataroot xmlns:od="urn:schemas-microsoft-com:officedata">
@@ -149,19 +100,7 @@ class TestBaseXMLParser:
         xml_file = tmp_path / "test.xml"
         xml_file.write_text(xml_content)
 
-        # Create dummy config files
-        (tmp_path / "tables.xml").write_text("<xml></xml>")
-        (tmp_path / "objects.xml").write_text("<xml></xml>")
-        (tmp_path / "table_deps.xml").write_text("<xml></xml>")
-        (tmp_path / "object_deps.xml").write_text("<xml></xml>")
-
-        config = AnalysisConfig(
-            tables_file=tmp_path / "tables.xml",
-            objects_file=tmp_path / "objects.xml",
-            table_dependencies_file=tmp_path / "table_deps.xml",
-            object_dependencies_file=tmp_path / "object_deps.xml"
-        )
-        parser = TableParser(config)
+        parser = TableParser(analysis_config)
         tree = parser.parse_file(xml_file)
         root = tree.getroot()
         element = root[0]
@@ -169,7 +108,7 @@ class TestBaseXMLParser:
         text = parser.get_text(element, 'TableName')
         assert text == "TestTable"
 
-    def test_get_text_non_namespaced_fallback(self, tmp_path):
+    def test_get_text_non_namespaced_fallback(self, tmp_path, analysis_config):
         """Test getting text from non-namespaced elements."""
         xml_content = """<?xml version="1.0"?>
         <dataroot>
@@ -181,19 +120,7 @@ class TestBaseXMLParser:
         xml_file = tmp_path / "test.xml"
         xml_file.write_text(xml_content)
 
-        # Create dummy config files
-        (tmp_path / "tables.xml").write_text("<xml></xml>")
-        (tmp_path / "objects.xml").write_text("<xml></xml>")
-        (tmp_path / "table_deps.xml").write_text("<xml></xml>")
-        (tmp_path / "object_deps.xml").write_text("<xml></xml>")
-
-        config = AnalysisConfig(
-            tables_file=tmp_path / "tables.xml",
-            objects_file=tmp_path / "objects.xml",
-            table_dependencies_file=tmp_path / "table_deps.xml",
-            object_dependencies_file=tmp_path / "object_deps.xml"
-        )
-        parser = TableParser(config)
+        parser = TableParser(analysis_config)
         tree = parser.parse_file(xml_file)
         root = tree.getroot()
         element = root[0]
@@ -201,7 +128,7 @@ class TestBaseXMLParser:
         text = parser.get_text(element, 'TableName')
         assert text == "TestTable"
 
-    def test_get_int_valid(self, tmp_path):
+    def test_get_int_valid(self, tmp_path, analysis_config):
         """Test getting valid integer values."""
         xml_content = """<?xml version="1.0"?>
         <dataroot xmlns:od="urn:schemas-microsoft-com:officedata">
@@ -213,19 +140,7 @@ class TestBaseXMLParser:
         xml_file = tmp_path / "test.xml"
         xml_file.write_text(xml_content)
 
-        # Create dummy config files
-        (tmp_path / "tables.xml").write_text("<xml></xml>")
-        (tmp_path / "objects.xml").write_text("<xml></xml>")
-        (tmp_path / "table_deps.xml").write_text("<xml></xml>")
-        (tmp_path / "object_deps.xml").write_text("<xml></xml>")
-
-        config = AnalysisConfig(
-            tables_file=tmp_path / "tables.xml",
-            objects_file=tmp_path / "objects.xml",
-            table_dependencies_file=tmp_path / "table_deps.xml",
-            object_dependencies_file=tmp_path / "object_deps.xml"
-        )
-        parser = TableParser(config)
+        parser = TableParser(analysis_config)
         tree = parser.parse_file(xml_file)
         root = tree.getroot()
         element = root[0]
@@ -233,7 +148,7 @@ class TestBaseXMLParser:
         value = parser.get_int(element, 'TableID')
         assert value == 123
 
-    def test_get_int_invalid(self, tmp_path):
+    def test_get_int_invalid(self, tmp_path, analysis_config):
         """Test getting invalid integer values."""
         xml_content = """<?xml version="1.0"?>
         <dataroot xmlns:od="urn:schemas-microsoft-com:officedata">
@@ -245,19 +160,7 @@ class TestBaseXMLParser:
         xml_file = tmp_path / "test.xml"
         xml_file.write_text(xml_content)
 
-        # Create dummy config files
-        (tmp_path / "tables.xml").write_text("<xml></xml>")
-        (tmp_path / "objects.xml").write_text("<xml></xml>")
-        (tmp_path / "table_deps.xml").write_text("<xml></xml>")
-        (tmp_path / "object_deps.xml").write_text("<xml></xml>")
-
-        config = AnalysisConfig(
-            tables_file=tmp_path / "tables.xml",
-            objects_file=tmp_path / "objects.xml",
-            table_dependencies_file=tmp_path / "table_deps.xml",
-            object_dependencies_file=tmp_path / "object_deps.xml"
-        )
-        parser = TableParser(config)
+        parser = TableParser(analysis_config)
         tree = parser.parse_file(xml_file)
         root = tree.getroot()
         element = root[0]
@@ -305,6 +208,105 @@ class TestBaseXMLParser:
         value = parser.get_bool(element, 'Active')
         assert value is True  # default
 
+    def test_namespace_spelling_learned_per_document(self, tmp_path, analysis_config):
+        """Test lookups prefer the document's spelling but still fall back."""
+        plain_file = tmp_path / "plain.xml"
+        plain_file.write_text(
+            '<dataroot xmlns:od="urn:schemas-microsoft-com:officedata">'
+            '<Analysis_Tables><TableID>1</TableID><od:TableName>Mixed</od:TableName>'
+            '</Analysis_Tables></dataroot>'
+        )
+        namespaced_file = tmp_path / "namespaced.xml"
+        namespaced_file.write_text(
+            '<dataroot xmlns:od="urn:schemas-microsoft-com:officedata">'
+            '<od:Analysis_Tables><od:TableID>2</od:TableID></od:Analysis_Tables></dataroot>'
+        )
+
+        parser = TableParser(analysis_config)
+        element = parser.find_elements(parser.parse_file(plain_file).getroot(), 'Analysis_Tables')[0]
+        assert parser.get_int(element, 'TableID') == 1
+        assert parser.get_text(element, 'TableName') == 'Mixed'
+
+        root = parser.parse_file(namespaced_file).getroot()
+        element = parser.find_elements(root, 'Analysis_Tables')[0]
+        assert parser.get_int(element, 'TableID') == 2
+
+    def test_process_streams_record_fields(self, tmp_path, analysis_config):
+        """Test the event pump passes field texts of each record to the callback."""
+        xml_content = """<?xml version="1.0"?>
+        <dataroot xmlns:od="urn:schemas-microsoft-com:officedata">
+          <od:Analysis_Tables>
+            <od:TableID> 1 </od:TableID>
+            <TableName>First<Note>ignored</Note></TableName>
+            <TableName>Duplicate</TableName>
+          </od:Analysis_Tables>
+          <Analysis_Objects>
+            <TableID>100</TableID>
+          </Analysis_Objects>
+          <Analysis_Tables>
+            <TableID>2</TableID>
+          </Analysis_Tables>
+        </dataroot>"""
+
+        xml_file = tmp_path / "pump.xml"
+        xml_file.write_text(xml_content)
+
+        parser = TableParser(analysis_config)
+        records = []
+        parser.process(xml_file, 'Analysis_Tables', ('TableID', 'TableName'), records.append)
+
+        assert records == [('1', 'First'), ('2', '')]
+
+    def test_process_rereads_modified_file(self, tmp_path, analysis_config):
+        """Test every call reads the file's current contents."""
+        xml_file = tmp_path / "reread.xml"
+        xml_file.write_text("<dataroot><Analysis_Tables><TableID>1</TableID></Analysis_Tables></dataroot>")
+
+        first, second, third = [], [], []
+        TableParser(analysis_config).process(xml_file, 'Analysis_Tables', ('TableID',), first.append)
+        TableParser(analysis_config).process(xml_file, 'Analysis_Tables', ('TableID',), second.append)
+
+        xml_file.write_text("<dataroot><Analysis_Tables><TableID>22</TableID></Analysis_Tables></dataroot>")
+        TableParser(analysis_config).process(xml_file, 'Analysis_Tables', ('TableID',), third.append)
+
+        assert first == second == [('1',)]
+        assert third == [('22',)]
+
+    def test_process_malformed_xml(self, tmp_path, analysis_config):
+        """Test the event pump raises XMLParseError for malformed XML."""
+        xml_file = tmp_path / "malformed.xml"
+        xml_file.write_text("<dataroot><Analysis_Tables>")
+
+        parser = TableParser(analysis_config)
+
+        with pytest.raises(XMLParseError):
+            parser.process(xml_file, 'Analysis_Tables', ('TableID',), lambda values: None)
+
+    def test_process_batches_columns(self, tmp_path, analysis_config):
+        """Test records are grouped into column batches of the requested size."""
+        records = "".join(
+            f"<Analysis_Tables><TableID>{i}</TableID><TableName>T{i}</TableName></Analysis_Tables>"
+            for i in range(1, 4)
+        )
+        xml_file = tmp_path / "batches.xml"
+        xml_file.write_text(f"<dataroot>{records}</dataroot>")
+
+        parser = TableParser(analysis_config)
+        batches = []
+        parser.process_batches(xml_file, 'Analysis_Tables', ('TableID', 'TableName'),
+                               batches.append, batch_size=2)
+
+        assert batches == [[('1', '2'), ('T1', 'T2')], [('3',), ('T3',)]]
+
+    def test_batch_conversions_match_scalar(self, analysis_config):
+        """Test batch int/bool conversion falls back to scalar semantics."""
+        parser = TableParser(analysis_config)
+
+        assert parser.to_int_batch(['1', '22'], 'ID') == [1, 22]
+        assert parser.to_int_batch(['1', '', 'x'], 'ID', default=-1) == [1, -1, -1]
+        assert parser.to_bool_batch(['True', 'no', '1'], 'Active') == [True, False, True]
+        assert parser.to_bool_batch(['false', 'maybe'], 'Active', default=True) == [False, True]
+
 
 class TestTableParser:
     """Test TableParser functionality."""
@@ -355,7 +357,7 @@ class TestTableParser:
         assert 1 in tables
         assert tables[1].table_name == "TestTable"
 
-    def test_parse_invalid_table_data(self, tmp_path):
+    def test_parse_invalid_table_data(self, tmp_path, analysis_config):
         """Test parsing invalid table data."""
         xml_content = """<?xml version="1.0"?>
         <dataroot xmlns:od="urn:schemas-microsoft-com:officedata">
@@ -372,19 +374,7 @@ class TestTableParser:
         xml_file = tmp_path / "invalid.xml"
         xml_file.write_text(xml_content)
 
-        # Create dummy config files
-        (tmp_path / "tables.xml").write_text("<xml></xml>")
-        (tmp_path / "objects.xml").write_text("<xml></xml>")
-        (tmp_path / "table_deps.xml").write_text("<xml></xml>")
-        (tmp_path / "object_deps.xml").write_text("<xml></xml>")
-
-        config = AnalysisConfig(
-            tables_file=tmp_path / "tables.xml",
-            objects_file=tmp_path / "objects.xml",
-            table_dependencies_file=tmp_path / "table_deps.xml",
-            object_dependencies_file=tmp_path / "object_deps.xml"
-        )
-        parser = TableParser(config)
+        parser = TableParser(analysis_config)
         tables = parser.parse(xml_file)
 
         # Should skip invalid entries but parse valid ones
@@ -392,7 +382,7 @@ class TestTableParser:
         assert len(tables) == 1
         assert 2 in tables
 
-    def test_parse_duplicate_table_ids(self, tmp_path):
+    def test_parse_duplicate_table_ids(self, tmp_path, analysis_config):
         """Test handling of duplicate table IDs."""
         xml_content = """<?xml version="1.0"?>
         <dataroot xmlns:od="urn:schemas-microsoft-com:officedata">
@@ -409,25 +399,37 @@ class TestTableParser:
         xml_file = tmp_path / "duplicates.xml"
         xml_file.write_text(xml_content)
 
-        # Create dummy config files
-        (tmp_path / "tables.xml").write_text("<xml></xml>")
-        (tmp_path / "objects.xml").write_text("<xml></xml>")
-        (tmp_path / "table_deps.xml").write_text("<xml></xml>")
-        (tmp_path / "object_deps.xml").write_text("<xml></xml>")
-
-        config = AnalysisConfig(
-            tables_file=tmp_path / "tables.xml",
-            objects_file=tmp_path / "objects.xml",
-            table_dependencies_file=tmp_path / "table_deps.xml",
-            object_dependencies_file=tmp_path / "object_deps.xml"
-        )
-        parser = TableParser(config)
+        parser = TableParser(analysis_config)
         tables = parser.parse(xml_file)
 
         # Should keep the first occurrence
         assert len(tables) == 1
         assert tables[1].table_name == "FirstTable"
 
+    def test_parse_negative_table_id(self, tmp_path, analysis_config):
+        """Test that non-positive table IDs are still rejected."""
+        xml_content = """<?xml version="1.0"?>
+        <dataroot xmlns:od="urn:schemas-microsoft-com:officedata">
+          <Analysis_Tables>
+            <TableID>-3</TableID>
+            <TableName>BadTable</TableName>
+          </Analysis_Tables>
+          <Analysis_Tables>
+            <TableID>4</TableID>
+            <TableName>GoodTable</TableName>
+          </Analysis_Tables>
+        </dataroot>"""
+
+        xml_file = tmp_path / "tables.xml"
+        xml_file.write_text(xml_content)
+
+        parser = TableParser(analysis_config)
+        tables = parser.parse(xml_file)
+
+        assert list(tables) == [4]
+        assert isinstance(tables[4], Table)
+        assert tables[4].referencing_objects == []
+
 
 class TestObjectParser:
     """Test ObjectParser functionality."""
@@ -463,6 +465,32 @@ class TestObjectParser:
         assert objects[200].object_name == "SalesQuery"
         assert objects[200].object_type == "Query"
 
+    def test_parse_plural_object_types(self, tmp_path, analysis_config):
+        """Test that plural object types from Access exports are normalised."""
+        xml_content = """<?xml version="1.0"?>
+        <dataroot xmlns:od="urn:schemas-microsoft-com:officedata">
+          <Analysis_Objects>
+            <ObjectID>100</ObjectID>
+            <ObjectName>CustomerForm</ObjectName>
+            <ObjectType>Forms</ObjectType>
+          </Analysis_Objects>
+          <Analysis_Objects>
+            <ObjectID>200</ObjectID>
+            <ObjectName>SalesQuery</ObjectName>
+            <ObjectType>Queries</ObjectType>
+          </Analysis_Objects>
+        </dataroot>"""
+
+        xml_file = tmp_path / "objects.xml"
+        xml_file.write_text(xml_content)
+
+        parser = ObjectParser(analysis_config)
+        objects = parser.parse(xml_file)
+
+        assert objects[100].object_type == "Form"
+        assert objects[200].object_type == "Query"
+        assert objects[100].css_class == "object-form"
+
     def test_parse_invalid_object_data(self, tmp_path, analysis_config):
         """Test parsing invalid object data."""
         xml_content = """<?xml version="1.0"?>
@@ -548,7 +576,7 @@ class TestDependencyParser:
         assert dependencies[0].target_object_id == 200
         assert dependencies[0].active is True
 
-    def test_parse_invalid_dependency_data(self, tmp_path):
+    def test_parse_invalid_dependency_data(self, tmp_path, analysis_config):
         """Test parsing invalid dependency data."""
         xml_content = """<?xml version="1.0"?>
         <dataroot xmlns:od="urn:schemas-microsoft-com:officedata">
@@ -567,19 +595,7 @@ class TestDependencyParser:
         xml_file = tmp_path / "invalid_deps.xml"
         xml_file.write_text(xml_content)
 
-        # Create dummy config files
-        (tmp_path / "tables.xml").write_text("<xml></xml>")
-        (tmp_path / "objects.xml").write_text("<xml></xml>")
-        (tmp_path / "table_deps.xml").write_text("<xml></xml>")
-        (tmp_path / "object_deps.xml").write_text("<xml></xml>")
-
-        config = AnalysisConfig(
-            tables_file=tmp_path / "tables.xml",
-            objects_file=tmp_path / "objects.xml",
-            table_dependencies_file=tmp_path / "table_deps.xml",
-            object_dependencies_file=tmp_path / "object_deps.xml"
-        )
-        parser = DependencyParser(config)
+        parser = DependencyParser(analysis_config)
         dependencies = parser.parse_table_dependencies(xml_file)
 
         # Should skip invalid entries
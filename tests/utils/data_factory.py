@@ -5,12 +5,41 @@ This module provides factories for creating test data objects
 that can be used across different test scenarios.
 """
 
-from typing import Dict, List, Tuple, Optional
+from dataclasses import replace
+from functools import lru_cache
+from itertools import cycle
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, Optional
 import random
-from database_dependency_analyzer.models.table import Table
-from database_dependency_analyzer.models.object import DatabaseObject, ObjectReference
+from database_dependency_analyzer.analyzers.statistics_calculator import StatisticsCalculator
+from database_dependency_analyzer.models.table import Table, ObjectReference
+from database_dependency_analyzer.models.object import DatabaseObject
 from database_dependency_analyzer.models.dependency import TableDependency, ObjectDependency
-from database_dependency_analyzer.models.analysis_result import AnalysisResult, AnalysisStatistics
+from database_dependency_analyzer.models.analysis_result import AnalysisResult
+
+
+# Realistic fixture data, defined once; factories build fresh models from it
+# on every call because callers mutate the results
+_REALISTIC_TABLE_NAMES = (
+    "Customers", "Orders", "OrderDetails", "Products", "Categories",
+    "Suppliers", "Shippers", "Employees", "Territories", "Regions",
+    "CustomerCustomerDemo", "CustomerDemographics", "Sales", "Inventory",
+    "PurchaseOrders", "Vendors", "Warehouses", "Transactions"
+)
+
+_REALISTIC_OBJECTS = (
+    (100, "CustomerForm", "Form"),
+    (101, "OrderEntry", "Form"),
+    (102, "ProductCatalog", "Form"),
+    (103, "CustomerQuery", "Query"),
+    (104, "OrderSummary", "Query"),
+    (105, "ProductSearch", "Query"),
+    (106, "InventoryMacro", "Macro"),
+    (107, "DataCleanup", "Macro"),
+    (108, "CustomerReport", "Report"),
+    (109, "SalesReport", "Report"),
+    (110, "InventoryReport", "Report")
+)
 
 
 class TableFactory:
@@ -19,9 +48,7 @@ class TableFactory:
     @staticmethod
     def create_table(table_id: int, name: str, is_used: bool = False) -> Table:
         """Create a single table."""
-        table = Table(table_id=table_id, table_name=name)
-        table.is_used = is_used
-        return table
+        return Table(table_id=table_id, table_name=name, is_used=is_used)
 
     @staticmethod
     def create_tables(count: int, prefix: str = "Table", start_id: int = 1) -> Dict[int, Table]:
@@ -36,17 +63,11 @@ class TableFactory:
     @staticmethod
     def create_realistic_tables() -> Dict[int, Table]:
         """Create a set of realistic table names."""
-        table_names = [
-            "Customers", "Orders", "OrderDetails", "Products", "Categories",
-            "Suppliers", "Shippers", "Employees", "Territories", "Regions",
-            "CustomerCustomerDemo", "CustomerDemographics", "Sales", "Inventory",
-            "PurchaseOrders", "Vendors", "Warehouses", "Transactions"
-        ]
-
-        tables = {}
-        for i, name in enumerate(table_names, 1):
-            tables[i] = TableFactory.create_table(i, name)
-        return tables
+        # Tables default to unused, so build them directly
+        return {
+            i: Table(table_id=i, table_name=name)
+            for i, name in enumerate(_REALISTIC_TABLE_NAMES, 1)
+        }
 
 
 class DatabaseObjectFactory:
@@ -64,35 +85,24 @@ class DatabaseObjectFactory:
     @staticmethod
     def create_objects(count: int, start_id: int = 100) -> Dict[int, DatabaseObject]:
         """Create multiple database objects with varied types."""
-        objects = {}
-        for i in range(count):
-            object_id = start_id + i
-            obj_type = DatabaseObjectFactory.OBJECT_TYPES[i % len(DatabaseObjectFactory.OBJECT_TYPES)]
-            name = f"{obj_type}{object_id}"
-            objects[object_id] = DatabaseObjectFactory.create_object(object_id, name, obj_type)
-        return objects
+        # Types cycle through OBJECT_TYPES, which are all valid, so the
+        # objects are built directly without create_object's check
+        object_types = DatabaseObjectFactory.OBJECT_TYPES
+        return {
+            object_id: DatabaseObject(object_id=object_id,
+                                      object_name=f"{obj_type}{object_id}",
+                                      object_type=obj_type)
+            for object_id, obj_type in zip(range(start_id, start_id + count),
+                                           cycle(object_types))
+        }
 
     @staticmethod
     def create_realistic_objects() -> Dict[int, DatabaseObject]:
         """Create realistic database objects."""
-        objects_data = [
-            (100, "CustomerForm", "Form"),
-            (101, "OrderEntry", "Form"),
-            (102, "ProductCatalog", "Form"),
-            (103, "CustomerQuery", "Query"),
-            (104, "OrderSummary", "Query"),
-            (105, "ProductSearch", "Query"),
-            (106, "InventoryMacro", "Macro"),
-            (107, "DataCleanup", "Macro"),
-            (108, "CustomerReport", "Report"),
-            (109, "SalesReport", "Report"),
-            (110, "InventoryReport", "Report")
-        ]
-
-        objects = {}
-        for obj_id, name, obj_type in objects_data:
-            objects[obj_id] = DatabaseObjectFactory.create_object(obj_id, name, obj_type)
-        return objects
+        return {
+            obj_id: DatabaseObject(object_id=obj_id, object_name=name, object_type=obj_type)
+            for obj_id, name, obj_type in _REALISTIC_OBJECTS
+        }
 
 
 class DependencyFactory:
@@ -101,36 +111,49 @@ class DependencyFactory:
     @staticmethod
     def create_table_dependency(object_id: int, table_id: int, is_active: bool = True) -> TableDependency:
         """Create a table dependency."""
-        return TableDependency(object_id=object_id, table_id=table_id, is_active=is_active)
+        return TableDependency(object_id=object_id, table_id=table_id, active=is_active)
 
     @staticmethod
     def create_object_dependency(parent_id: int, child_id: int, is_active: bool = True) -> ObjectDependency:
         """Create an object dependency."""
-        return ObjectDependency(parent_object_id=parent_id, child_object_id=child_id, is_active=is_active)
+        return ObjectDependency(source_object_id=parent_id, target_object_id=child_id, active=is_active)
 
     @staticmethod
     def create_random_dependencies(objects: Dict[int, DatabaseObject],
                                  tables: Dict[int, Table],
-                                 dependency_ratio: float = 0.7) -> Tuple[List[TableDependency], List[ObjectDependency]]:
-        """Create random dependencies between objects and tables."""
+                                 dependency_ratio: float = 0.7,
+                                 rng: Optional[random.Random] = None) -> Tuple[List[TableDependency], List[ObjectDependency]]:
+        """Create random dependencies between objects and tables.
+
+        Draws come from ``rng`` when given, otherwise from the module-level
+        ``random`` state.
+        """
+        if rng is None:
+            rng = random
         table_deps = []
         object_deps = []
 
         object_ids = list(objects.keys())
         table_ids = list(tables.keys())
 
-        # Create table dependencies
-        for table_id in table_ids:
-            if random.random() < dependency_ratio:
-                object_id = random.choice(object_ids)
-                is_active = random.choice([True, False])
+        # Create table dependencies, drawing candidate objects and flags in bulk
+        candidate_objects = rng.choices(object_ids, k=len(table_ids))
+        flags = rng.choices((True, False), k=len(table_ids))
+        for table_id, object_id, is_active in zip(table_ids, candidate_objects, flags):
+            if rng.random() < dependency_ratio:
                 table_deps.append(DependencyFactory.create_table_dependency(object_id, table_id, is_active))
 
         # Create some object dependencies (forms using queries, etc.)
-        for _ in range(len(object_ids) // 3):
-            parent_id = random.choice(object_ids)
-            child_id = random.choice([oid for oid in object_ids if oid != parent_id])
-            is_active = random.choice([True, False])
+        # Pick a distinct child by drawing from the other n - 1 positions,
+        # rather than building a list without the parent on every iteration
+        num_objects = len(object_ids)
+        for is_active in rng.choices((True, False), k=num_objects // 3):
+            parent_index = rng.randrange(num_objects)
+            child_index = rng.randrange(num_objects - 1)
+            if child_index >= parent_index:
+                child_index += 1
+            parent_id = object_ids[parent_index]
+            child_id = object_ids[child_index]
             object_deps.append(DependencyFactory.create_object_dependency(parent_id, child_id, is_active))
 
         return table_deps, object_deps
@@ -142,44 +165,83 @@ class AnalysisResultFactory:
     @staticmethod
     def create_empty_result() -> AnalysisResult:
         """Create an empty analysis result."""
-        return AnalysisResult()
+        return AnalysisResult(
+            tables={},
+            objects={},
+            statistics=StatisticsCalculator().calculate({}, {}, []),
+            processing_time=0.0
+        )
 
     @staticmethod
     def create_from_data(tables: Dict[int, Table],
                         objects: Dict[int, DatabaseObject],
                         table_deps: List[TableDependency],
                         object_deps: List[ObjectDependency]) -> AnalysisResult:
-        """Create an analysis result from data."""
-        result = AnalysisResult()
-        result.tables = tables.copy()
-        result.objects = objects.copy()
-        result.table_dependencies = table_deps.copy()
-        result.object_dependencies = object_deps.copy()
-
-        # Mark used tables
-        used_table_ids = {dep.table_id for dep in table_deps if dep.is_active}
-        for table_id in used_table_ids:
-            if table_id in result.tables:
-                result.tables[table_id].is_used = True
-
-        # Calculate statistics
-        total_tables = len(result.tables)
-        used_tables = len([t for t in result.tables.values() if t.is_used])
-        result.statistics.total_tables = total_tables
-        result.statistics.used_tables = used_tables
-        result.statistics.unused_tables = total_tables - used_tables
-        result.statistics.total_objects = len(result.objects)
-
+        """Create an analysis result from data.
+
+        Tables with an active dependency are marked used. The caller's
+        instances are frozen and shared, so used tables are replaced in
+        the result's copy rather than modified.
+        """
+        used_table_ids = {dep.table_id for dep in table_deps if dep.active}
+        result_tables = {
+            table_id: replace(table, is_used=True) if table_id in used_table_ids else table
+            for table_id, table in tables.items()
+        }
+
+        result = AnalysisResult(
+            tables=result_tables,
+            objects=objects.copy(),
+            statistics=StatisticsCalculator().calculate(result_tables, objects, table_deps),
+            processing_time=0.0
+        )
+        result.table_dependencies = list(table_deps)
+        result.object_dependencies = list(object_deps)
         return result
 
     @staticmethod
-    def create_realistic_result() -> AnalysisResult:
-        """Create a realistic analysis result."""
-        tables = TableFactory.create_realistic_tables()
-        objects = DatabaseObjectFactory.create_realistic_objects()
-        table_deps, object_deps = DependencyFactory.create_random_dependencies(objects, tables)
+    def create_realistic_result(seed: Optional[int] = 0) -> AnalysisResult:
+        """Create a realistic analysis result.
+
+        The result for a seed is generated once and each call returns a copy
+        of it; pass ``seed=None`` for freshly drawn dependencies.
+        """
+        if seed is None:
+            return _build_realistic_result(random)
+        return _clone_result(_realistic_result_prototype(seed))
+
+
+def _build_realistic_result(rng) -> AnalysisResult:
+    """Build a realistic analysis result with dependencies drawn from ``rng``."""
+    tables = TableFactory.create_realistic_tables()
+    objects = DatabaseObjectFactory.create_realistic_objects()
+    table_deps, object_deps = DependencyFactory.create_random_dependencies(objects, tables, rng=rng)
+
+    return AnalysisResultFactory.create_from_data(tables, objects, table_deps, object_deps)
+
 
-        return AnalysisResultFactory.create_from_data(tables, objects, table_deps, object_deps)
+@lru_cache(maxsize=None)
+def _realistic_result_prototype(seed: int) -> AnalysisResult:
+    """Realistic result for a seed; never handed out, only cloned."""
+    return _build_realistic_result(random.Random(seed))
+
+
+def _clone_result(result: AnalysisResult) -> AnalysisResult:
+    """Copy a result's containers so the copy can be modified independently.
+
+    The models inside are frozen and shared; dataclasses.replace also resets
+    the result's lazily built caches.
+    """
+    statistics = replace(
+        result.statistics,
+        unused_table_ids=list(result.statistics.unused_table_ids),
+        object_type_distribution=dict(result.statistics.object_type_distribution)
+    )
+    clone = replace(result, tables=dict(result.tables), objects=dict(result.objects),
+                    statistics=statistics)
+    clone.table_dependencies = list(result.table_dependencies)
+    clone.object_dependencies = list(result.object_dependencies)
+    return clone
 
 
 class ObjectReferenceFactory:
@@ -188,7 +250,7 @@ class ObjectReferenceFactory:
     @staticmethod
     def create_reference(object_id: int, name: str, obj_type: str, is_active: bool = True) -> ObjectReference:
         """Create an object reference."""
-        return ObjectReference(object_id=object_id, object_name=name, object_type=obj_type, is_active=is_active)
+        return ObjectReference(object_id=object_id, object_name=name, object_type=obj_type, active=is_active)
 
     @staticmethod
     def create_from_objects(objects: Dict[int, DatabaseObject]) -> List[ObjectReference]:
@@ -201,34 +263,110 @@ class ObjectReferenceFactory:
         return references
 
 
-def create_test_dataset(size: str = "small") -> Tuple[Dict[int, Table], Dict[int, DatabaseObject], List[TableDependency], List[ObjectDependency]]:
+# (tables, objects, dependency ratio) for each create_test_dataset size
+_DATASET_SIZES = {
+    "small": (5, 4, 0.6),
+    "medium": (20, 15, 0.7),
+    "large": (100, 50, 0.8),
+}
+
+
+def create_test_dataset(size: str = "small", rng: Optional[random.Random] = None) -> Tuple[Dict[int, Table], Dict[int, DatabaseObject], List[TableDependency], List[ObjectDependency]]:
     """
     Create a complete test dataset.
 
     Args:
         size: Size of dataset ("small", "medium", "large")
+        rng: Random generator for the dependencies; defaults to the
+            module-level ``random`` state
 
     Returns:
         Tuple of (tables, objects, table_dependencies, object_dependencies)
     """
-    if size == "small":
-        tables = TableFactory.create_tables(5)
-        objects = DatabaseObjectFactory.create_objects(4, 100)
-        table_deps, object_deps = DependencyFactory.create_random_dependencies(objects, tables, 0.6)
-    elif size == "medium":
-        tables = TableFactory.create_tables(20)
-        objects = DatabaseObjectFactory.create_objects(15, 100)
-        table_deps, object_deps = DependencyFactory.create_random_dependencies(objects, tables, 0.7)
-    elif size == "large":
-        tables = TableFactory.create_tables(100)
-        objects = DatabaseObjectFactory.create_objects(50, 100)
-        table_deps, object_deps = DependencyFactory.create_random_dependencies(objects, tables, 0.8)
-    else:
-        raise ValueError(f"Unknown size: {size}")
+    try:
+        table_count, object_count, dependency_ratio = _DATASET_SIZES[size]
+    except KeyError:
+        raise ValueError(f"Unknown size: {size}") from None
+
+    tables = TableFactory.create_tables(table_count)
+    objects = DatabaseObjectFactory.create_objects(object_count, 100)
+    table_deps, object_deps = DependencyFactory.create_random_dependencies(
+        objects, tables, dependency_ratio, rng
+    )
+    return tables, objects, table_deps, object_deps
+
+
+@lru_cache(maxsize=32)
+def create_test_dataset_seeded(size: str = "small", seed: int = 0) -> Tuple[Mapping[int, Table], Mapping[int, DatabaseObject], Tuple[TableDependency, ...], Tuple[ObjectDependency, ...]]:
+    """
+    Create a reproducible test dataset, generated once per (size, seed).
 
+    The result is cached and shared between callers, so it is returned as
+    read-only mappings and tuples; use copy_dataset for a mutable copy.
+
+    Args:
+        size: Size of dataset ("small", "medium", "large")
+        seed: Seed for the dependency generator
+
+    Returns:
+        Tuple of (tables, objects, table_dependencies, object_dependencies)
+    """
+    tables, objects, table_deps, object_deps = create_test_dataset(size, random.Random(seed))
+    return MappingProxyType(tables), MappingProxyType(objects), tuple(table_deps), tuple(object_deps)
+
+
+def copy_dataset(dataset: Tuple[Mapping[int, Table], Mapping[int, DatabaseObject], Tuple[TableDependency, ...], Tuple[ObjectDependency, ...]]) -> Tuple[Dict[int, Table], Dict[int, DatabaseObject], List[TableDependency], List[ObjectDependency]]:
+    """Return a mutable copy of a dataset from create_test_dataset_seeded."""
+    tables, objects, table_deps, object_deps = dataset
+    return dict(tables), dict(objects), list(table_deps), list(object_deps)
+
+
+def _empty_case():
+    """Dataset with no data at all."""
+    return {}, {}, [], []
+
+
+def _no_dependencies_case():
+    """Tables and objects without any dependencies."""
+    tables = TableFactory.create_tables(5)
+    objects = DatabaseObjectFactory.create_objects(3, 100)
+    return tables, objects, [], []
+
+
+def _circular_deps_case():
+    """Objects that depend on each other in a cycle."""
+    # Create circular object dependencies
+    objects = DatabaseObjectFactory.create_objects(3, 100)
+    object_deps = [
+        ObjectDependency(100, 101, True),
+        ObjectDependency(101, 102, True),
+        ObjectDependency(102, 100, True),  # Creates cycle
+    ]
+    tables = TableFactory.create_tables(2)
+    table_deps = [TableDependency(100, 1, True)]
     return tables, objects, table_deps, object_deps
 
 
+def _duplicate_ids_case():
+    """The same table dependency listed twice."""
+    # This would normally be invalid, but let's create it for testing
+    tables = {1: TableFactory.create_table(1, "Table1")}
+    objects = {100: DatabaseObjectFactory.create_object(100, "Object1", "Form")}
+    table_deps = [
+        TableDependency(100, 1, True),
+        TableDependency(100, 1, False),  # Duplicate
+    ]
+    return tables, objects, table_deps, []
+
+
+_EDGE_CASES = {
+    "empty": _empty_case,
+    "no_dependencies": _no_dependencies_case,
+    "circular_deps": _circular_deps_case,
+    "duplicate_ids": _duplicate_ids_case,
+}
+
+
 def create_edge_case_dataset(case: str) -> Tuple[Dict[int, Table], Dict[int, DatabaseObject], List[TableDependency], List[ObjectDependency]]:
     """
     Create datasets for edge cases.
@@ -239,31 +377,8 @@ def create_edge_case_dataset(case: str) -> Tuple[Dict[int, Table], Dict[int, Dat
     Returns:
         Tuple of test data
     """
-    if case == "empty":
-        return {}, {}, [], []
-    elif case == "no_dependencies":
-        tables = TableFactory.create_tables(5)
-        objects = DatabaseObjectFactory.create_objects(3, 100)
-        return tables, objects, [], []
-    elif case == "circular_deps":
-        # Create circular object dependencies
-        objects = DatabaseObjectFactory.create_objects(3, 100)
-        object_deps = [
-            ObjectDependency(100, 101, True),
-            ObjectDependency(101, 102, True),
-            ObjectDependency(102, 100, True),  # Creates cycle
-        ]
-        tables = TableFactory.create_tables(2)
-        table_deps = [TableDependency(100, 1, True)]
-        return tables, objects, table_deps, object_deps
-    elif case == "duplicate_ids":
-        # This would normally be invalid, but let's create it for testing
-        tables = {1: TableFactory.create_table(1, "Table1")}
-        objects = {100: DatabaseObjectFactory.create_object(100, "Object1", "Form")}
-        table_deps = [
-            TableDependency(100, 1, True),
-            TableDependency(100, 1, False),  # Duplicate
-        ]
-        return tables, objects, table_deps, []
-    else:
-        raise ValueError(f"Unknown edge case: {case}")
\ No newline at end of file
+    try:
+        build = _EDGE_CASES[case]
+    except KeyError:
+        raise ValueError(f"Unknown edge case: {case}") from None
+    return build()
\ No newline at end of file
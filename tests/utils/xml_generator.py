@@ -5,125 +5,131 @@ This module provides utilities for generating realistic XML test data
 that matches Microsoft Access XML export format.
 """
 
-from typing import List, Dict, Any, Optional
+from itertools import chain, cycle
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Dict, Any, Union
 import random
 from datetime import datetime
 
 
-def generate_sample_tables_xml(num_tables: int = 10, include_namespace: bool = True) -> str:
-    """Generate sample XML for testing table parsing."""
-    xml_parts = ['<?xml version="1.0" encoding="utf-8"?>']
+def _xml_lines(records: Iterable[str], include_namespace: bool = True) -> Iterator[str]:
+    """Yield the XML declaration, dataroot element and records as document lines."""
+    root = ('<dataroot xmlns:od="urn:schemas-microsoft-com:officedata">'
+            if include_namespace else '<dataroot>')
+    return chain(('<?xml version="1.0" encoding="utf-8"?>', root), records, ('</dataroot>',))
+
+
+def _xml_document(records: Iterable[str], include_namespace: bool = True) -> str:
+    """Wrap formatted records in the XML declaration and dataroot element.
+
+    Each record is a single preformatted multi-line string, so the whole
+    document is built by one join.
+    """
+    return '\n'.join(_xml_lines(records, include_namespace))
+
+
+def _write_xml_document(path: Union[str, Path], records: Iterable[str],
+                        include_namespace: bool = True) -> Path:
+    """Stream the same document as ``_xml_document`` to a file.
+
+    Records are written as they are generated, so memory use does not grow
+    with the number of records.
+    """
+    path = Path(path)
+    lines = _xml_lines(records, include_namespace)
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(next(lines))
+        for line in lines:
+            f.write('\n')
+            f.write(line)
+    return path
 
-    if include_namespace:
-        xml_parts.append('<dataroot xmlns:od="urn:schemas-microsoft-com:officedata">')
-    else:
-        xml_parts.append('<dataroot>')
 
+def generate_sample_tables_xml(num_tables: int = 10, include_namespace: bool = True) -> str:
+    """Generate sample XML for testing table parsing."""
     table_names = [
         "Customers", "Orders", "Products", "Suppliers", "Categories",
         "Employees", "Shippers", "OrderDetails", "Inventory", "Sales"
     ]
-
-    for i in range(1, num_tables + 1):
-        table_name = table_names[(i-1) % len(table_names)]
-        if num_tables > len(table_names):
-            table_name = f"{table_name}{i}"
-
-        xml_parts.extend([
-            '  <Analysis_Tables>',
-            f'    <TableID>{i}</TableID>',
-            f'    <TableName>{table_name}</TableName>',
-            '  </Analysis_Tables>'
-        ])
-
-    xml_parts.append('</dataroot>')
-    return '\n'.join(xml_parts)
+    # Names repeat once the list runs out, so number them to keep them unique
+    numbered = num_tables > len(table_names)
+
+    def records():
+        for i in range(1, num_tables + 1):
+            table_name = table_names[(i-1) % len(table_names)]
+            if numbered:
+                table_name = f"{table_name}{i}"
+            yield ('  <Analysis_Tables>\n'
+                   f'    <TableID>{i}</TableID>\n'
+                   f'    <TableName>{table_name}</TableName>\n'
+                   '  </Analysis_Tables>')
+
+    return _xml_document(records(), include_namespace)
+
+
+_OBJECT_TYPES = ("Form", "Query", "Macro", "Report")
+_OBJECT_NAME_PREFIXES = {
+    "Form": ("frm", "Form", "dlg"),
+    "Query": ("qry", "Query", "qsel"),
+    "Macro": ("mac", "Macro", "mcr"),
+    "Report": ("rpt", "Report", "rep")
+}
+# (type, prefix) of the nth generated object: types cycle every 4 objects and
+# prefixes every 3, so the pairs repeat every 12
+_OBJECT_NAME_PARTS = tuple(
+    (obj_type, _OBJECT_NAME_PREFIXES[obj_type][k % 3])
+    for k, obj_type in zip(range(12), cycle(_OBJECT_TYPES))
+)
 
 
 def generate_sample_objects_xml(num_objects: int = 20, include_namespace: bool = True) -> str:
     """Generate sample XML for testing object parsing."""
-    xml_parts = ['<?xml version="1.0" encoding="utf-8"?>']
-
-    if include_namespace:
-        xml_parts.append('<dataroot xmlns:od="urn:schemas-microsoft-com:officedata">')
-    else:
-        xml_parts.append('<dataroot>')
-
-    object_types = ["Form", "Query", "Macro", "Report"]
-    type_names = {
-        "Form": ["frm", "Form", "dlg"],
-        "Query": ["qry", "Query", "qsel"],
-        "Macro": ["mac", "Macro", "mcr"],
-        "Report": ["rpt", "Report", "rep"]
-    }
+    def records():
+        for i, (obj_type, prefix) in zip(range(1, num_objects + 1), cycle(_OBJECT_NAME_PARTS)):
+            yield ('  <Analysis_Objects>\n'
+                   f'    <ObjectID>{i + 99}</ObjectID>\n'  # Start from 100
+                   f'    <ObjectName>{prefix}{obj_type}{i}</ObjectName>\n'
+                   f'    <ObjectType>{obj_type}</ObjectType>\n'
+                   '  </Analysis_Objects>')
 
-    for i in range(1, num_objects + 1):
-        obj_type = object_types[(i-1) % len(object_types)]
-        prefix = type_names[obj_type][(i-1) % len(type_names[obj_type])]
-        object_name = f"{prefix}{obj_type}{i}"
-
-        xml_parts.extend([
-            '  <Analysis_Objects>',
-            f'    <ObjectID>{i + 99}</ObjectID>',  # Start from 100
-            f'    <ObjectName>{object_name}</ObjectName>',
-            f'    <ObjectType>{obj_type}</ObjectType>',
-            '  </Analysis_Objects>'
-        ])
-
-    xml_parts.append('</dataroot>')
-    return '\n'.join(xml_parts)
+    return _xml_document(records(), include_namespace)
 
 
 def generate_sample_table_dependencies_xml(num_deps: int = 30, include_namespace: bool = True) -> str:
     """Generate sample XML for testing table dependency parsing."""
-    xml_parts = ['<?xml version="1.0" encoding="utf-8"?>']
+    # Draw every IsActive flag in one RNG call, already in its XML spelling
+    flags = random.choices(('true', 'false'), k=num_deps)
 
-    if include_namespace:
-        xml_parts.append('<dataroot xmlns:od="urn:schemas-microsoft-com:officedata">')
-    else:
-        xml_parts.append('<dataroot>')
+    def records():
+        for i, is_active in enumerate(flags, 1):
+            object_id = 100 + (i % 20)  # Reference objects 100-119
+            table_id = 1 + (i % 10)     # Reference tables 1-10
 
-    for i in range(1, num_deps + 1):
-        object_id = 100 + (i % 20)  # Reference objects 100-119
-        table_id = 1 + (i % 10)     # Reference tables 1-10
-        is_active = random.choice([True, False])
+            yield ('  <Analysis_TableDependencies>\n'
+                   f'    <ObjectID>{object_id}</ObjectID>\n'
+                   f'    <TableID>{table_id}</TableID>\n'
+                   f'    <IsActive>{is_active}</IsActive>\n'
+                   '  </Analysis_TableDependencies>')
 
-        xml_parts.extend([
-            '  <Analysis_TableDependencies>',
-            f'    <ObjectID>{object_id}</ObjectID>',
-            f'    <TableID>{table_id}</TableID>',
-            f'    <IsActive>{str(is_active).lower()}</IsActive>',
-            '  </Analysis_TableDependencies>'
-        ])
-
-    xml_parts.append('</dataroot>')
-    return '\n'.join(xml_parts)
+    return _xml_document(records(), include_namespace)
 
 
 def generate_sample_object_dependencies_xml(num_deps: int = 15, include_namespace: bool = True) -> str:
     """Generate sample XML for testing object dependency parsing."""
-    xml_parts = ['<?xml version="1.0" encoding="utf-8"?>']
-
-    if include_namespace:
-        xml_parts.append('<dataroot xmlns:od="urn:schemas-microsoft-com:officedata">')
-    else:
-        xml_parts.append('<dataroot>')
+    flags = random.choices(('true', 'false'), k=num_deps)
 
-    for i in range(1, num_deps + 1):
-        parent_id = 100 + (i % 20)
-        child_id = 100 + ((i + 5) % 20)
-        is_active = random.choice([True, False])
+    def records():
+        for i, is_active in enumerate(flags, 1):
+            parent_id = 100 + (i % 20)
+            child_id = 100 + ((i + 5) % 20)
 
-        xml_parts.extend([
-            '  <Analysis_ObjectDependencies>',
-            f'    <ParentObjectID>{parent_id}</ParentObjectID>',
-            f'    <ChildObjectID>{child_id}</ChildObjectID>',
-            f'    <IsActive>{str(is_active).lower()}</IsActive>',
-            '  </Analysis_ObjectDependencies>'
-        ])
+            yield ('  <Analysis_ObjectDependencies>\n'
+                   f'    <ParentObjectID>{parent_id}</ParentObjectID>\n'
+                   f'    <ChildObjectID>{child_id}</ChildObjectID>\n'
+                   f'    <IsActive>{is_active}</IsActive>\n'
+                   '  </Analysis_ObjectDependencies>')
 
-    xml_parts.append('</dataroot>')
-    return '\n'.join(xml_parts)
+    return _xml_document(records(), include_namespace)
 
 
 def generate_malformed_xml() -> str:
@@ -144,21 +150,48 @@ def generate_empty_xml() -> str:
 </dataroot>"""
 
 
+def _large_table_records(num_tables: int) -> Iterator[str]:
+    """Yield the table records of the large performance-testing document."""
+    return (
+        '  <Analysis_Tables>\n'
+        f'    <TableID>{i}</TableID>\n'
+        f'    <TableName>LargeTable{i}</TableName>\n'
+        '  </Analysis_Tables>'
+        for i in range(1, num_tables + 1)
+    )
+
+
 def generate_large_xml_file(num_tables: int = 10000) -> str:
     """Generate large XML file for performance testing."""
-    xml_parts = ['<?xml version="1.0" encoding="utf-8"?>',
-                 '<dataroot xmlns:od="urn:schemas-microsoft-com:officedata">']
+    return _xml_document(_large_table_records(num_tables))
+
+
+def generate_large_xml_file_bytes(num_tables: int = 10000) -> bytes:
+    """Generate the ``generate_large_xml_file`` document as UTF-8 bytes.
 
-    for i in range(1, num_tables + 1):
-        xml_parts.extend([
-            '  <Analysis_Tables>',
-            f'    <TableID>{i}</TableID>',
-            f'    <TableName>LargeTable{i}</TableName>',
-            '  </Analysis_Tables>'
-        ])
+    Records are formatted straight into bytes, so saving the document with
+    ``save_xml_files`` needs no separate encoding pass.
+    """
+    record = (b'  <Analysis_Tables>\n'
+              b'    <TableID>%d</TableID>\n'
+              b'    <TableName>LargeTable%d</TableName>\n'
+              b'  </Analysis_Tables>')
+    lines = [line.encode('utf-8') for line in _xml_lines(())]
+    return b'\n'.join(chain(lines[:-1], (record % (i, i) for i in range(1, num_tables + 1)),
+                            lines[-1:]))
+
+
+def write_large_xml_file(path: Union[str, Path], num_tables: int = 10000) -> Path:
+    """Write the ``generate_large_xml_file`` document straight to disk.
+
+    Args:
+        path: File to write.
+        num_tables: Number of tables to generate.
 
-    xml_parts.append('</dataroot>')
-    return '\n'.join(xml_parts)
+    Returns:
+        Path of the written file.
+    """
+    return _write_xml_document(path, _large_table_records(num_tables))
 
 
 def generate_realistic_dataset(num_tables: int = 100, num_objects: int = 50, dependency_ratio: float = 0.7) -> Dict[str, str]:
@@ -195,20 +228,20 @@ def generate_realistic_dataset(num_tables: int = 100, num_objects: int = 50, dep
     }
 
 
-def save_xml_files(xml_data: Dict[str, str], output_dir: str) -> Dict[str, str]:
+def save_xml_files(xml_data: Dict[str, Union[str, bytes, Callable[[Path], Any]]],
+                   output_dir: str) -> Dict[str, str]:
     """
     Save XML data to files.
 
     Args:
-        xml_data: Dictionary with XML content
+        xml_data: Dictionary with XML content as text or UTF-8 bytes, or with
+            callables that write the content to the path they are given
+            (e.g. ``write_large_xml_file``)
         output_dir: Directory to save files
 
     Returns:
         Dictionary mapping data types to file paths
     """
-    import os
-    from pathlib import Path
-
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
@@ -223,7 +256,15 @@ def save_xml_files(xml_data: Dict[str, str], output_dir: str) -> Dict[str, str]:
     for data_type, filename in file_mapping.items():
         if data_type in xml_data:
             file_path = output_path / filename
-            file_path.write_text(xml_data[data_type], encoding='utf-8')
+            content = xml_data[data_type]
+            if callable(content):
+                # Streams straight to disk without building the document
+                content(file_path)
+            elif isinstance(content, bytes):
+                # Already UTF-8 encoded
+                file_path.write_bytes(content)
+            else:
+                file_path.write_text(content, encoding='utf-8')
             saved_files[data_type] = str(file_path)
 
     return saved_files
\ No newline at end of file